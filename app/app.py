@@ -2,45 +2,121 @@
 Flask application for the Mackney Gazette website.
 """
 import os
+import csv
 import json
-import pandas as pd
-from datetime import datetime
-from flask import Flask, render_template, request, redirect, url_for, abort
+from collections import defaultdict
+from itertools import islice
+from datetime import datetime, timezone
+from functools import lru_cache
+from flask import Flask, render_template, request, redirect, url_for, abort, g, has_app_context
+
+# Use orjson for decoding when it is installed, it is considerably faster
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 app = Flask(__name__)
 
 # Configuration
 app.config['ARTICLES_FILE'] = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'articles.csv')
 
+# Parsed articles, reused until articles.csv changes on disk, as an
+# (mtime_ns, (articles, categories, by_id, by_category)) tuple so that
+# concurrent requests always see a matching mtime and data
+_ARTICLES_CACHE = {
+    "entry": None
+}
 
-def load_articles():
+# Rendered pages keyed by request path, valid for one version of the
+# articles file and one calendar day (the date is shown in the header),
+# as a ((mtime_ns, date), pages) tuple
+_PAGE_CACHE = {
+    "entry": None
+}
+_PAGE_CACHE_SIZE = 1024
+
+
+def _load_all():
     """
-    Load and parse articles from the CSV file.
+    Load and parse articles from the CSV file, along with the category list
+    and lookup indexes built from them.
+    
+    The parsed data is cached and only re-read when the modification time
+    of the CSV file changes.
     
     Returns:
-        List of article dictionaries
+        Tuple of (articles, categories, by_id, by_category) where articles is
+        the list of article dictionaries sorted newest first, categories is the
+        sorted list of category names, by_id maps article IDs to articles and
+        by_category maps category names to their (sorted) articles
+    
+    Within a request, the modification time of the data returned is kept in
+    g.articles_mtime (None if nothing could be loaded), so the page and its
+    ETag are tied to the data actually rendered.
     """
     try:
-        df = pd.read_csv(app.config['ARTICLES_FILE'])
+        mtime = os.stat(app.config['ARTICLES_FILE']).st_mtime_ns
+    except OSError as e:
+        print(f"Error loading articles: {e}")
+        _ARTICLES_CACHE["entry"] = None
+        _set_loaded_mtime(None)
+        return [], [], {}, {}
+    
+    entry = _ARTICLES_CACHE["entry"]
+    if entry is not None and entry[0] == mtime:
+        _set_loaded_mtime(mtime)
+        return entry[1]
+    
+    try:
+        with open(app.config['ARTICLES_FILE'], 'r', newline='', encoding='utf-8') as file:
+            articles = list(csv.DictReader(file))
         
-        # Convert DataFrame to list of dictionaries
-        articles = df.to_dict('records')
+        # Sort by publication date (newest first)
+        articles.sort(key=lambda a: a.get('publication_date') or '', reverse=True)
         
-        # Parse the JSON stored in the 'images' column
+        # Parse the JSON stored in the 'images' column and index articles by
+        # ID and by category in the same pass (each list keeps the date order)
+        by_id = {}
+        by_category = defaultdict(list)
         for article in articles:
-            if 'images' in article and article['images']:
-                try:
-                    article['images'] = json.loads(article['images'])
-                except:
-                    article['images'] = []
-                    
-        # Sort by publication date (newest first)
-        articles.sort(key=lambda x: x.get('publication_date', ''), reverse=True)
+            images = article.get('images')
+            try:
+                article['images'] = json_loads(images) if images else []
+            except:
+                article['images'] = []
+            
+            by_id[article.get('article_id')] = article
+            if 'category' in article and article['category']:
+                by_category[article['category']].append(article)
+        
+        categories = sorted(by_category)
         
-        return articles
+        data = (articles, categories, by_id, by_category)
+        _ARTICLES_CACHE["entry"] = (mtime, data)
+        
+        _set_loaded_mtime(mtime)
+        return data
     except Exception as e:
         print(f"Error loading articles: {e}")
-        return []
+        _set_loaded_mtime(None)
+        return [], [], {}, {}
+
+
+def _set_loaded_mtime(mtime):
+    """Record the modification time of the articles loaded for this request."""
+    if has_app_context():
+        g.articles_mtime = mtime
+
+
+def load_articles():
+    """
+    Load and parse articles from the CSV file.
+    
+    Returns:
+        List of article dictionaries
+    """
+    return _load_all()[0]
 
 
 def get_categories():
@@ -50,21 +126,48 @@ def get_categories():
     Returns:
         List of category names
     """
-    articles = load_articles()
-    categories = set()
+    return _load_all()[1]
+
+
+def _render_page(template_name, **context):
+    """
+    Render a page template, reusing the previously rendered HTML for the
+    same path while the articles and the current date are unchanged.
     
-    for article in articles:
-        if 'category' in article and article['category']:
-            categories.add(article['category'])
-            
-    return sorted(list(categories))
+    Args:
+        template_name: Name of the template to render
+        **context: Template variables, excluding current_date
+        
+    Returns:
+        The rendered HTML
+    """
+    current_date = datetime.now().strftime('%B %d, %Y')
+    mtime = g.get('articles_mtime')
+    if mtime is None:
+        # Nothing was loaded for this request, don't keep the page
+        return render_template(template_name, current_date=current_date, **context)
+    
+    key = (mtime, current_date)
+    entry = _PAGE_CACHE["entry"]
+    if entry is None or entry[0] != key:
+        entry = (key, {})
+        _PAGE_CACHE["entry"] = entry
+    
+    pages = entry[1]
+    page = pages.get(request.path)
+    if page is None:
+        page = render_template(template_name, current_date=current_date, **context)
+        # Bound the cache, category names come straight from the URL
+        if len(pages) < _PAGE_CACHE_SIZE:
+            pages[request.path] = page
+    
+    return page
 
 
 @app.route('/')
 def home():
     """Home page with latest articles."""
-    articles = load_articles()
-    categories = get_categories()
+    articles, categories, _, _ = _load_all()
     
     # Featured articles (first 3)
     featured = articles[:3] if len(articles) >= 3 else articles
@@ -72,60 +175,76 @@ def home():
     # Recent articles (next 6, excluding featured)
     recent = articles[3:9] if len(articles) > 3 else []
     
-    return render_template(
+    return _render_page(
         'index.html',
         featured_articles=featured,
         recent_articles=recent,
-        categories=categories,
-        current_date=datetime.now().strftime('%B %d, %Y')
+        categories=categories
     )
 
 
 @app.route('/article/<article_id>')
 def article(article_id):
     """Individual article page."""
-    articles = load_articles()
-    categories = get_categories()
+    _, categories, by_id, by_category = _load_all()
     
     # Find the article with matching ID
-    article = next((a for a in articles if a.get('article_id') == article_id), None)
+    article = by_id.get(article_id)
     
     if not article:
         abort(404)
     
     # Get related articles from the same category
-    related = [a for a in articles if a.get('category') == article.get('category') and a.get('article_id') != article_id][:3]
+    same_category = by_category.get(article.get('category'), [])
+    related = list(islice((a for a in same_category if a.get('article_id') != article_id), 3))
     
-    return render_template(
+    return _render_page(
         'article.html',
         article=article,
         related_articles=related,
-        categories=categories,
-        current_date=datetime.now().strftime('%B %d, %Y')
+        categories=categories
     )
 
 
 @app.route('/category/<category_name>')
 def category(category_name):
     """Category page with articles from a specific category."""
-    articles = load_articles()
-    categories = get_categories()
+    _, categories, _, by_category = _load_all()
     
     # Filter articles by category
-    filtered_articles = [a for a in articles if a.get('category') == category_name]
+    filtered_articles = by_category.get(category_name, [])
     
-    return render_template(
+    return _render_page(
         'category.html',
         category=category_name,
         articles=filtered_articles,
-        categories=categories,
-        current_date=datetime.now().strftime('%B %d, %Y')
+        categories=categories
     )
 
 
-@app.template_filter('format_date')
-def format_date(date_str):
-    """Format date strings for display."""
+@app.after_request
+def add_cache_headers(response):
+    """Add ETag and Last-Modified headers to article pages so repeat visits get a 304."""
+    mtime = g.get('articles_mtime')
+    if (request.endpoint not in ('home', 'article', 'category')
+            or response.status_code != 200 or mtime is None):
+        return response
+    
+    # Pages also show the current date, so they change at midnight too
+    now = datetime.now()
+    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
+    last_modified = max(mtime / 1e9, midnight)
+    
+    response.last_modified = datetime.fromtimestamp(int(last_modified), timezone.utc)
+    response.set_etag(f"{mtime}-{now.strftime('%Y%m%d')}")
+    response.cache_control.public = True
+    response.cache_control.max_age = 60
+    return response.make_conditional(request)
+
+
+@lru_cache(maxsize=4096)
+def _format_date(date_str):
+    """Format a date string for display, memoized per distinct string."""
     try:
         dt = datetime.strptime(date_str, '%Y-%m-%d')
         return dt.strftime('%B %d, %Y')
@@ -133,5 +252,13 @@ def format_date(date_str):
         return date_str
 
 
+@app.template_filter('format_date')
+def format_date(date_str):
+    """Format date strings for display."""
+    return _format_date(date_str)
+
+
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # Only enable the debugger and reloader when explicitly requested
+    debug = os.environ.get('FLASK_DEBUG', '0') == '1'
+    app.run(debug=debug, host='0.0.0.0', port=5000, use_reloader=debug, threaded=True)
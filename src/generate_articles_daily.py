@@ -6,16 +6,17 @@ It uses the article generation functionality from generate_article.py and config
 from articles_daily_config.yaml.
 
 Usage:
-    python -m src.generate_articles_daily [--config CONFIG_PATH]
+    python -m src.generate_articles_daily [--config CONFIG_PATH] [--verbose]
 
 Parameters:
     --config: Optional path to configuration file (defaults to articles_daily_config.yaml in project root)
+    --verbose: Also log the town and people data sampled for each article
 """
 
-import os
 import yaml
 import argparse
-import time
+import asyncio
+import logging
 import shutil
 import pandas as pd
 from pathlib import Path
@@ -23,7 +24,17 @@ from typing import Optional, Dict, Any, List
 import datetime
 
 # Import the article generation function
-from src.utils.data.generate_article import create_new_story
+from src.utils.data.generate_article import create_stories_async
+
+# Prefer the libyaml-backed loader, falling back to the pure Python one
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Project paths
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = PROJECT_ROOT / 'data'
 
 
 def generate_articles_daily(config_path: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -39,15 +50,15 @@ def generate_articles_daily(config_path: Optional[str] = None) -> List[Dict[str,
     # Use default config path if none provided
     if config_path is None:
         # Look for config in project root directory
-        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        config_path = os.path.join(project_root, "articles_daily_config.yaml")
+        config_path = PROJECT_ROOT / "articles_daily_config.yaml"
 
     # Load configuration
     with open(config_path, 'r') as file:
-        config = yaml.safe_load(file)
+        config = yaml.load(file, Loader=SafeLoader)
 
     # Extract configuration values
     article_count = config["articles"]["count"]
+    max_workers = config["articles"].get("max_workers", 4)
     backup_before_save = config["articles"]["save_options"]["backup_before_save"]
     article_limit = config["articles"]["save_options"]["article_limit"]
 
@@ -57,29 +68,32 @@ def generate_articles_daily(config_path: Optional[str] = None) -> List[Dict[str,
 
     # Backup articles.csv if enabled
     if backup_before_save:
-        data_dir = Path(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) / 'data'
-        articles_csv = data_dir / 'articles.csv'
+        articles_csv = DATA_DIR / 'articles.csv'
         
         if articles_csv.exists():
-            backup_file = data_dir / f'articles.csv.bak'
-            shutil.copy2(articles_csv, backup_file)
-            print(f"Backed up articles file to {backup_file}")
-
-    # Generate the specified number of articles
-    generated_articles = []
-    for i in range(article_count):
-        print(f"\n=== Generating article {i+1} of {article_count} ===")
-        try:
-            # Generate article
-            article = create_new_story()
-            generated_articles.append(article)
+            backup_file = DATA_DIR / f'articles.csv.bak'
             
-            # Add a small delay between articles to avoid rate limiting issues
-            if i < article_count - 1:
-                time.sleep(1)
-                
-        except Exception as e:
-            print(f"Error generating article {i+1}: {e}")
+            # The backup has to be a real copy rather than a hardlink, since the
+            # articles file is appended to in place. copy2 preserves the mtime,
+            # so an unchanged file doesn't need copying again.
+            source_stat = articles_csv.stat()
+            backup_stat = backup_file.stat() if backup_file.exists() else None
+            if (backup_stat is not None
+                    and backup_stat.st_size == source_stat.st_size
+                    and backup_stat.st_mtime_ns == source_stat.st_mtime_ns):
+                print(f"Articles backup {backup_file} is already up to date")
+            else:
+                shutil.copy2(articles_csv, backup_file)
+                print(f"Backed up articles file to {backup_file}")
+
+    # Generate the specified number of articles, with up to max_workers
+    # OpenAI requests in flight at once
+    generated_articles = []
+    print(f"\n=== Generating {article_count} articles, {max(1, max_workers)} at a time ===")
+    try:
+        generated_articles = asyncio.run(create_stories_async(article_count, max_concurrency=max_workers))
+    except Exception as e:
+        print(f"Error generating articles: {e}")
 
     print(f"\n=== Article Generation Summary ===")
     print(f"Successfully generated {len(generated_articles)} of {article_count} articles")
@@ -87,8 +101,7 @@ def generate_articles_daily(config_path: Optional[str] = None) -> List[Dict[str,
     # Prune old articles if limit is set
     if article_limit > 0:
         try:
-            data_dir = Path(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) / 'data'
-            articles_csv = data_dir / 'articles.csv'
+            articles_csv = DATA_DIR / 'articles.csv'
             
             if articles_csv.exists():
                 # Read existing articles
@@ -96,12 +109,10 @@ def generate_articles_daily(config_path: Optional[str] = None) -> List[Dict[str,
                 
                 # Check if we have more than the limit
                 if len(articles_df) > article_limit:
-                    # Sort by publication date and last_updated (newest first)
+                    # Keep only the newest articles (by last_updated) up to the limit,
+                    # selecting them without sorting the whole file
                     articles_df['last_updated'] = pd.to_datetime(articles_df['last_updated'])
-                    articles_df = articles_df.sort_values(by='last_updated', ascending=False)
-                    
-                    # Keep only the newest articles up to the limit
-                    articles_df = articles_df.head(article_limit)
+                    articles_df = articles_df.nlargest(article_limit, 'last_updated')
                     
                     # Save the pruned dataframe
                     articles_df.to_csv(articles_csv, index=False)
@@ -119,8 +130,14 @@ def main():
     # Parse command line arguments
     parser = argparse.ArgumentParser(description="Generate daily articles")
     parser.add_argument("--config", help="Path to configuration file", default=None)
+    parser.add_argument("--verbose", action="store_true", help="Show the data sampled for each article")
     args = parser.parse_args()
     
+    # Log article progress; the sampling details are only shown with --verbose
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    if args.verbose:
+        logging.getLogger("src").setLevel(logging.DEBUG)
+    
     # Generate articles
     generate_articles_daily(args.config)
 
@@ -11,14 +11,25 @@ Parameters:
     --config: Optional path to configuration file (defaults to town_init_config.yaml in project root)
 """
 
-import os
 import yaml
+import sys
 import argparse
+from heapq import nlargest
+from pathlib import Path
 from typing import Optional
 
 from src.utils.data.generate_town import TownGenerator
 from src.utils.data.generate_people import generate_demographic_csv
 
+# Prefer the libyaml-backed loader, falling back to the pure Python one
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Project root directory, where the default config lives
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
 
 def initialise_town(config_path: Optional[str] = None):
     """
@@ -30,12 +41,11 @@ def initialise_town(config_path: Optional[str] = None):
     # Use default config path if none provided
     if config_path is None:
         # Look for config in project root directory
-        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        config_path = os.path.join(project_root, "town_init_config.yaml")
+        config_path = PROJECT_ROOT / "town_init_config.yaml"
     
     # Load configuration
     with open(config_path, 'r') as file:
-        config = yaml.safe_load(file)
+        config = yaml.load(file, Loader=SafeLoader)
     
     # Extract town configuration
     town_name = config["town"]["name"]
@@ -45,6 +55,7 @@ def initialise_town(config_path: Optional[str] = None):
     # Calculate population size
     population_scale = config["population"]["scale_factor"]
     min_people = config["population"]["min_people"]
+    workers = config["population"].get("workers", 1)
     
     # Print initialization information
     print(f"Initializing town: {town_name}")
@@ -66,46 +77,48 @@ def initialise_town(config_path: Optional[str] = None):
             "publication_frequency": config["newspaper"]["publication_frequency"]
         }
         
-    # Log detailed town information
-    print("\n===== TOWN DETAILS =====")
-    print(f"Town Name: {town_data['name']}")
-    print(f"Population: {town_data['population']:,}")
-    print(f"Founded: {town_data.get('founded_year', 'Unknown')}")
+    # Log detailed town information, written out in one go
+    lines = []
+    lines.append("\n===== TOWN DETAILS =====")
+    lines.append(f"Town Name: {town_data['name']}")
+    lines.append(f"Population: {town_data['population']:,}")
+    lines.append(f"Founded: {town_data.get('founded_year', 'Unknown')}")
     if 'area_km2' in town_data:
-        print(f"Area: {town_data['area_km2']:.2f} km²")
-    print(f"Country: {town_data.get('country', 'United Kingdom')}")
+        lines.append(f"Area: {town_data['area_km2']:.2f} km²")
+    lines.append(f"Country: {town_data.get('country', 'United Kingdom')}")
     
     # Log infrastructure counts
-    print("\n----- Infrastructure -----")
-    print(f"Streets: {len(town_data.get('streets', []))}")
-    print(f"Businesses: {len(town_data.get('businesses', []))}")
-    print(f"Landmarks: {len(town_data.get('landmarks', []))}")
-    print(f"Parks: {len(town_data.get('parks', []))}")
-    print(f"Schools: {len(town_data.get('schools', []))}")
-    print(f"Municipal Services: {len(town_data.get('services', []))}")
+    lines.append("\n----- Infrastructure -----")
+    lines.append(f"Streets: {len(town_data.get('streets', []))}")
+    lines.append(f"Businesses: {len(town_data.get('businesses', []))}")
+    lines.append(f"Landmarks: {len(town_data.get('landmarks', []))}")
+    lines.append(f"Parks: {len(town_data.get('parks', []))}")
+    lines.append(f"Schools: {len(town_data.get('schools', []))}")
+    lines.append(f"Municipal Services: {len(town_data.get('services', []))}")
     
     # Log some sample businesses
     if town_data.get('businesses'):
-        print("\n----- Notable Establishments -----")
+        lines.append("\n----- Notable Establishments -----")
         # Sort businesses by importance if available, otherwise show first 5
         businesses = town_data['businesses']
         if businesses and 'importance' in businesses[0]:
-            sorted_businesses = sorted(businesses, key=lambda x: x.get('importance', 0), reverse=True)[:5]
+            sorted_businesses = nlargest(5, businesses, key=lambda x: x.get('importance', 0))
         else:
             sorted_businesses = businesses[:5]
             
         for i, business in enumerate(sorted_businesses):
-            print(f"{i+1}. {business['name']} ({business['type']}) - {business.get('street', 'Unknown location')}")
+            lines.append(f"{i+1}. {business['name']} ({business['type']}) - {business.get('street', 'Unknown location')}")
     
     # Log newspaper information
     if "newspaper" in town_data:
-        print(f"\n----- Local Newspaper -----")
-        print(f"Name: {town_data['newspaper']['name']}")
-        print(f"Tagline: {town_data['newspaper']['tagline']}")
-        print(f"Founded: {town_data['newspaper']['founded_year']}")
-        print(f"Frequency: {town_data['newspaper']['publication_frequency']}")
+        lines.append(f"\n----- Local Newspaper -----")
+        lines.append(f"Name: {town_data['newspaper']['name']}")
+        lines.append(f"Tagline: {town_data['newspaper']['tagline']}")
+        lines.append(f"Founded: {town_data['newspaper']['founded_year']}")
+        lines.append(f"Frequency: {town_data['newspaper']['publication_frequency']}")
     
-    print("\n=========================")
+    lines.append("\n=========================")
+    sys.stdout.write("\n".join(lines) + "\n")
     
     # Save town data to JSON
     json_path = town_generator.save_to_json("town_data.json", "data")
@@ -118,14 +131,17 @@ def initialise_town(config_path: Optional[str] = None):
     
     # Generate and save demographic data to CSV
     csv_path = generate_demographic_csv(num_people, "people_data.csv", 
-                                      output_dir="data", locale=locale, seed=seed)
+                                      output_dir="data", locale=locale, seed=seed,
+                                      workers=workers)
     print(f"Population data saved to {csv_path}")
     
     # Display population statistics
-    print("\n===== POPULATION DETAILS =====")
-    print(f"Total town population: {town_population:,}")
-    print(f"Generated residents: {num_people:,} ({population_scale*100:.1f}% of total)")
-    print(f"Data stored in: {csv_path}")
+    lines = []
+    lines.append("\n===== POPULATION DETAILS =====")
+    lines.append(f"Total town population: {town_population:,}")
+    lines.append(f"Generated residents: {num_people:,} ({population_scale*100:.1f}% of total)")
+    lines.append(f"Data stored in: {csv_path}")
+    sys.stdout.write("\n".join(lines) + "\n")
     
     print("\nTown initialization completed successfully!")
 
@@ -2,17 +2,158 @@
 Module for generating mock news articles for the Mackney Gazette.
 """
 import os
+import re
+import csv
+import atexit
 import yaml
 import json
 import random
+import shutil
 import datetime
-import pandas as pd
+from bisect import bisect_left
+from collections import defaultdict
+from itertools import accumulate, count
 import httpx
 import time
+import asyncio
+import logging
+import threading
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
-from src.utils.llm.openai import call_openai_api
+from openai import AsyncOpenAI
+
+from src.utils.llm.openai import call_openai_api, call_openai_api_async, initialize_async_openai_client
+
+logger = logging.getLogger(__name__)
+
+# Paths to the article config and to the data files in the project's data directory
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+CONFIG_FILE = Path(__file__).resolve().parent / 'article_config.yaml'
+DATA_DIR = PROJECT_ROOT / 'data'
+TOWN_DATA_FILE = DATA_DIR / 'town_data.json'
+PEOPLE_DATA_FILE = DATA_DIR / 'people_data.csv'
+ARTICLES_CSV_FILE = DATA_DIR / 'articles.csv'
+
+# Maximum number of stories create_stories_async generates at once (OpenAI
+# request and image searches)
+DEFAULT_MAX_CONCURRENCY = 50
+
+# Punctuation dropped from article titles when they are turned into slugs
+_SLUG_STRIP_PATTERN = re.compile(r"[,.'\"]")
+
+# Columns of the articles CSV file
+ARTICLE_COLUMNS = [
+    'article_id', 'title', 'slug', 'body', 'summary', 'images',
+    'publication_date', 'last_updated', 'author', 
+    'author_persona', 'author_style', 'category', 
+    'status', 'story_status', 'town_data', 'people_data',
+    'seriousness', 'parent_article_id'
+]
+
+# Prefer the libyaml-backed loader, falling back to the pure Python one
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+    logger.warning("libyaml is not available, falling back to the pure Python YAML loader")
+
+# Use orjson for decoding when it is installed, it is considerably faster
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# Serializes writes to articles.csv when stories are generated concurrently
+_CSV_LOCK = threading.Lock()
+
+# Column order of each articles CSV file once checked, keyed by path, as
+# ((st_ino, st_mtime_ns), columns) tuples so a replaced or rewritten file is
+# read again
+_CSV_HEADERS = {}
+
+# Append handles kept open on articles CSV files, keyed by path, as
+# (file, writer) tuples
+_CSV_APPENDERS = {}
+
+# Minimum time between Unsplash searches, shared by every thread so
+# concurrently generated stories don't exceed the API's rate limit
+IMAGE_SEARCH_INTERVAL = 1.0
+_IMAGE_SEARCH_LOCK = threading.Lock()
+_LAST_IMAGE_SEARCH = {"time": None}
+
+# Numbers the stories sampled by this process, so stories sampled within the
+# same microsecond still get distinct article IDs
+_ARTICLE_NUMBERS = count(1)
+
+# Parsed data files keyed by (path, kind), as (mtime_ns, data) tuples
+_FILE_CACHE = {}
+
+def _load_cached(file_path, kind, parse, binary=False):
+    """
+    Parse a file, reusing the previous result while its mtime is unchanged.
+    
+    Args:
+        file_path: Path to the file
+        kind: Name distinguishing the parser used for the file
+        parse: Function taking an open file and returning the parsed data
+        binary: Whether to open the file in binary mode
+        
+    Returns:
+        The parsed data (shared between callers, so it must not be modified)
+    """
+    mtime = os.stat(file_path).st_mtime_ns
+    key = (str(file_path), kind)
+    cached = _FILE_CACHE.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    with open(file_path, 'rb' if binary else 'r', newline=None if binary else '') as file:
+        data = parse(file)
+    _FILE_CACHE[key] = (mtime, data)
+    return data
+
+def _weighted_choices(weights):
+    """Split a {choice: weight} mapping into its choices and cumulative weights."""
+    return list(weights.keys()), list(accumulate(weights.values()))
+
+def _read_config(file):
+    """
+    Parse a YAML config, indexing any authors by their specialties and
+    precomputing the cumulative weights of the article seed draws.
+    """
+    config = yaml.load(file, Loader=SafeLoader)
+    
+    if isinstance(config, dict) and 'authors' in config:
+        specialty_index = defaultdict(list)
+        for author in config['authors']:
+            for specialty in author.get('specialties', []):
+                specialty_index[specialty].append(author)
+        config['_specialty_index'] = dict(specialty_index)
+        
+        # Cumulative author weights per specialty: the specialists share a 70%
+        # chance of being picked, and all authors share the remaining 30%
+        authors = config['authors']
+        author_cum_weights = {}
+        for specialty, specialists in specialty_index.items():
+            weights = [
+                (0.7 / len(specialists) if author in specialists else 0) + 0.3 / len(authors)
+                for author in authors
+            ]
+            author_cum_weights[specialty] = list(accumulate(weights))
+        config['_author_cum_weights'] = author_cum_weights
+    
+    if isinstance(config, dict) and isinstance(config.get('article_seed'), dict):
+        article_seed = config['article_seed']
+        seriousness_weights = (article_seed.get('tone') or {}).get('seriousness')
+        if seriousness_weights:
+            config['_seriousness_choices'] = _weighted_choices(seriousness_weights)
+        
+        demographic_weights = (article_seed.get('people_data') or {}).get('demographic_weights') or {}
+        if demographic_weights.get('age'):
+            config['_age_group_choices'] = _weighted_choices(demographic_weights['age'])
+    
+    return config
 
 def load_config(config_file):
     """
@@ -22,10 +163,44 @@ def load_config(config_file):
         config_file: Path to the YAML configuration file
         
     Returns:
-        Dict containing configuration data
+        Dict containing configuration data. If it lists authors, the
+        '_specialty_index' key maps each specialty to its authors and
+        '_author_cum_weights' holds the cumulative weights for picking an
+        author for each specialty. If it has an article seed,
+        '_seriousness_choices' and '_age_group_choices' hold the choices and
+        cumulative weights of the seriousness and age group draws.
     """
-    with open(config_file, 'r') as file:
-        return yaml.safe_load(file)
+    return _load_cached(config_file, 'yaml', _read_config)
+
+# Town features that stories sample from
+TOWN_FEATURES = ('streets', 'landmarks', 'businesses', 'events')
+
+# How each town feature is sampled: the feature, its default max_count, its
+# label in the logs, and the (label, key, default) details logged for it
+TOWN_FEATURE_SAMPLING = (
+    ('streets', 3, 'Street', ()),
+    ('landmarks', 2, 'Landmark', (
+        ('Located on', 'street', 'Unknown Street'),
+        ('Established', 'established_year', 'Unknown'),
+    )),
+    ('businesses', 2, 'Business', (
+        ('Located on', 'street', 'Unknown Street'),
+        ('Founded', 'founded_year', 'Unknown'),
+    )),
+    ('events', 2, 'Event', (
+        ('Date', 'date', 'Unknown Date'),
+        ('Location', 'location', 'Unknown Location'),
+    )),
+)
+
+def _read_town_json(file):
+    """Parse town data, freezing the feature lists into tuples."""
+    town_data = json_loads(file.read())
+    if isinstance(town_data, dict):
+        for feature in TOWN_FEATURES:
+            if isinstance(town_data.get(feature), list):
+                town_data[feature] = tuple(town_data[feature])
+    return town_data
 
 def load_town_data(file_path):
     """
@@ -35,15 +210,83 @@ def load_town_data(file_path):
         file_path: Path to the town data JSON file
         
     Returns:
-        Dict containing town data
+        Dict containing town data, with the streets, landmarks, businesses
+        and events as tuples
     """
     try:
-        with open(file_path, 'r') as file:
-            return json.load(file)
+        return _load_cached(file_path, 'json', _read_town_json, binary=True)
     except Exception as e:
-        print(f"Error loading town data: {e}")
+        logger.error("Error loading town data: %s", e)
         return {}
         
+# Age groups used by the people demographic weights in article_config.yaml
+AGE_GROUP_BINS = [float('-inf'), 17, 30, 50, 70, float('inf')]
+AGE_GROUP_LABELS = ['<18', '18-30', '31-50', '51-70', '71+']
+
+def _age_group(age):
+    """Return the AGE_GROUP_LABELS label for an age, or None if it is missing."""
+    if age is None or age != age:
+        return None
+    return AGE_GROUP_LABELS[bisect_left(AGE_GROUP_BINS, age) - 1]
+
+# Columns of people_data.csv that articles use, the rest aren't kept in memory
+PEOPLE_FIELDS = (
+    'first_name', 'last_name', 'age', 'occupation', 'location',
+    'temperament_type', 'temperament_description'
+)
+
+def _read_people_csv(file):
+    """
+    Read people data into records for sampling, tagging each person with
+    their age group, and group the records by age group.
+    """
+    reader = csv.DictReader(file)
+    fields = [field for field in PEOPLE_FIELDS if field in (reader.fieldnames or ())]
+    people_records = tuple({field: row[field] for field in fields} for row in reader)
+    people_by_age_group = {}
+    if people_records and 'age' in people_records[0]:
+        people_by_age_group = {label: [] for label in AGE_GROUP_LABELS}
+        for person in people_records:
+            try:
+                age = float(person['age'])
+            except (TypeError, ValueError):
+                age = None
+            else:
+                person['age'] = int(age) if age.is_integer() else age
+            person['age_group'] = _age_group(age)
+            if person['age_group'] is not None:
+                people_by_age_group[person['age_group']].append(person)
+        people_by_age_group = {label: tuple(people) for label, people in people_by_age_group.items()}
+    return people_records, people_by_age_group
+
+def _load_people(file_path):
+    """
+    Load people data from a CSV file, along with the people in each age group.
+    
+    Args:
+        file_path: Path to the people data CSV file
+        
+    Returns:
+        Tuple of a tuple of a record dict per person, holding their
+        PEOPLE_FIELDS and age group, and a dict mapping each age group label
+        to a tuple of the records of the people in it (the records are
+        shared, so they must not be modified)
+    """
+    try:
+        return _load_cached(file_path, 'csv', _read_people_csv)
+    except Exception as e:
+        logger.error("Error loading people data: %s", e)
+        return (), {}
+
+def _read_people_frame(file):
+    """Read people data into a DataFrame and tag each person with their age group."""
+    import pandas as pd
+    
+    people_data = pd.read_csv(file)
+    if 'age' in people_data.columns:
+        people_data['age_group'] = pd.cut(people_data['age'], bins=AGE_GROUP_BINS, labels=AGE_GROUP_LABELS)
+    return people_data
+
 def load_people_data(file_path):
     """
     Load people data from a CSV file.
@@ -52,44 +295,97 @@ def load_people_data(file_path):
         file_path: Path to the people data CSV file
         
     Returns:
-        DataFrame containing people data
+        DataFrame containing people data, with an added categorical
+        'age_group' column
     """
     try:
-        return pd.read_csv(file_path)
+        return _load_cached(file_path, 'dataframe', _read_people_frame)
     except Exception as e:
-        print(f"Error loading people data: {e}")
+        logger.error("Error loading people data: %s", e)
+        import pandas as pd
         return pd.DataFrame()
 
-def generate_article_content(
-    category: str,
-    author_info: Dict[str, Any],
-    article_town_data: Dict[str, Any] = None,
-    article_people_data: List[Dict[str, Any]] = None,
-    seriousness: str = "balanced",
-    config: Dict[str, Any] = None
-) -> Dict[str, str]:
+def _close_csv_appender(csv_file):
+    """Close the append handle kept open on a CSV file, if there is one."""
+    appender = _CSV_APPENDERS.pop(str(csv_file), None)
+    if appender is not None:
+        appender[0].close()
+
+def _close_csv_appenders():
+    """Close every append handle kept open on a CSV file."""
+    for csv_file in list(_CSV_APPENDERS):
+        _close_csv_appender(csv_file)
+
+atexit.register(_close_csv_appenders)
+
+def _append_csv_rows(csv_file, fieldnames, rows):
     """
-    Generate article title, body, and summary using the OpenAI API.
+    Append rows to a CSV file, reusing the handle opened by earlier rows.
+    
+    The handle is reopened if the file has been replaced or its columns have
+    changed since. The rows are flushed so other readers of the file see them
+    straight away.
     
     Args:
-        category: The article category (e.g., Politics, Sports)
-        author_info: Information about the author including name, persona, and writing style
-        article_town_data: Optional town data to include in the article
-        article_people_data: Optional list of people data to include in the article
-        seriousness: The tone of the article from very_lighthearted to very_serious
-        config: Configuration data loaded from article_config.yaml
+        csv_file: Path to the CSV file
+        fieldnames: Column order of the file
+        rows: Dicts of values to write
+    """
+    key = str(csv_file)
+    appender = _CSV_APPENDERS.get(key)
+    if appender is not None and (
+        appender[1].fieldnames != fieldnames
+        or os.fstat(appender[0].fileno()).st_ino != os.stat(csv_file).st_ino
+    ):
+        _close_csv_appender(csv_file)
+        appender = None
+    
+    if appender is None:
+        file = open(csv_file, 'a', newline='', encoding='utf-8')
+        appender = (file, csv.DictWriter(file, fieldnames=fieldnames, restval=''))
+        _CSV_APPENDERS[key] = appender
+    
+    appender[1].writerows(rows)
+    appender[0].flush()
+
+def _sample_k(seq, k, rng=random):
+    """
+    Draw k distinct items from a sequence using a partial Fisher-Yates shuffle.
+    
+    Only the swapped indices are tracked, so a draw costs O(k) regardless of
+    the length of the sequence.
+    
+    Args:
+        seq: Sequence to sample from
+        k: Number of items to draw (at most len(seq))
+        rng: Random number generator to use
         
     Returns:
-        Dictionary containing the generated title, body, and summary
+        List of k items from seq in random order
     """
-    print("\n=== GENERATING ARTICLE CONTENT WITH OPENAI ===")
-    
-    # If config is not provided, load it
-    if config is None:
-        current_dir = Path(__file__).parent
-        config_file = current_dir / 'article_config.yaml'
-        config = load_config(config_file)
+    n = len(seq)
+    swapped = {}
+    sample = []
+    for i in range(k):
+        j = rng.randrange(i, n)
+        sample.append(seq[swapped.get(j, j)])
+        swapped[j] = swapped.get(i, i)
+    return sample
+
+def _build_article_request(
+    category: str,
+    author_info: Dict[str, Any],
+    article_town_data: Dict[str, Any],
+    article_people_data: List[Dict[str, Any]],
+    seriousness: str,
+    config: Dict[str, Any]
+):
+    """
+    Build the OpenAI request for an article's title, body, and summary.
     
+    Returns:
+        Tuple of the system prompt, the messages, and the model arguments
+    """
     # Get prompt templates from config
     prompt_templates = config.get('prompts', {})
     
@@ -108,40 +404,36 @@ def generate_article_content(
     )
     
     # Build town context string
-    town_context = ""
+    town_parts = []
     if article_town_data and article_town_data.get('town_name'):
-        town_context += f"The article should be set in {article_town_data['town_name']}, "
-        town_context += f"a town with a population of {article_town_data.get('town_population', 'unknown')}. "
-        town_context += "there is no need to mention the town's name in the article body, but it should be clear where the article is set for example you can use the street names."
+        town_parts.append(f"The article should be set in {article_town_data['town_name']}, ")
+        town_parts.append(f"a town with a population of {article_town_data.get('town_population', 'unknown')}. ")
+        town_parts.append("there is no need to mention the town's name in the article body, but it should be clear where the article is set for example you can use the street names.")
         
-        # Add featured streets if available
-        if 'town_features' in article_town_data and 'streets' in article_town_data['town_features']:
-            streets = article_town_data['town_features']['streets']
-            if streets:
-                town_context += f"You may mention these streets: {', '.join([s.get('name', 'Unknown Street') for s in streets])}. "
-                
-        # Add landmarks if available
-        if 'town_features' in article_town_data and 'landmarks' in article_town_data['town_features']:
-            landmarks = article_town_data['town_features']['landmarks']
-            if landmarks:
-                town_context += f"You may mention these landmarks: {', '.join([l.get('name', 'Unknown Landmark') for l in landmarks])}. "
-                
-        # Add businesses if available
-        if 'town_features' in article_town_data and 'businesses' in article_town_data['town_features']:
-            businesses = article_town_data['town_features']['businesses']
-            if businesses:
-                town_context += f"You may mention these local businesses: {', '.join([b.get('name', 'Unknown Business') for b in businesses])}. "
+        # Add featured streets, landmarks and businesses if available
+        town_features = article_town_data.get('town_features', {})
+        for feature, description, unknown_name in (
+            ('streets', 'streets', 'Unknown Street'),
+            ('landmarks', 'landmarks', 'Unknown Landmark'),
+            ('businesses', 'local businesses', 'Unknown Business'),
+        ):
+            items = town_features.get(feature)
+            if items:
+                names = ', '.join(item.get('name', unknown_name) for item in items)
+                town_parts.append(f"You may mention these {description}: {names}. ")
+    town_context = ''.join(town_parts)
     
     # Build people context string
-    people_context = ""
-    if article_people_data and len(article_people_data) > 0:
-        people_context += "Include quotes from these people in your article:\n"
+    people_parts = []
+    if article_people_data:
+        people_parts.append("Include quotes from these people in your article:\n")
         for person in article_people_data:
             name = f"{person.get('first_name', '')} {person.get('last_name', '')}"
-            people_context += f"- {name}, {person.get('age', 'Unknown')}, {person.get('occupation', 'resident')}"
+            people_parts.append(f"- {name}, {person.get('age', 'Unknown')}, {person.get('occupation', 'resident')}")
             if person.get('temperament_type'):
-                people_context += f", who tends to be {person.get('temperament_description', 'a local resident')}"
-            people_context += ".\n"
+                people_parts.append(f", who tends to be {person.get('temperament_description', 'a local resident')}")
+            people_parts.append(".\n")
+    people_context = ''.join(people_parts)
     
     # Create user prompt using template from config
     user_prompt_template = prompt_templates.get('user_prompt', '')
@@ -164,99 +456,162 @@ def generate_article_content(
         'response_format': {'type': 'json_object'}  # Request JSON response
     }
     
+    return system_prompt, messages, model_args
+
+def _parse_article_content(category: str, response_text: str) -> Dict[str, Any]:
+    """Extract the article content from the JSON response of the OpenAI API."""
+    response_data = json_loads(response_text)
+    
+    # Extract the article content
+    title = response_data.get('title', f"Article about {category}")
+    body = response_data.get('body', "No content generated.")
+    summary = response_data.get('summary', "No summary available.")
+    # Extract image suggestions (defaulting to empty list if not provided)
+    images = response_data.get('images', [])
+    # Extract story status (defaulting to "ongoing" if not provided)
+    story_status = response_data.get('story_status', "ongoing")
+    # Normalize story status to ensure it's either "ongoing" or "concluded"
+    story_status = story_status.lower().strip()
+    if story_status not in ["ongoing", "concluded"]:
+        story_status = "ongoing"  # Default if invalid value
+    
+    logger.info("Generated title: %s", title)
+    logger.debug("Summary: %s...", summary[:100])
+    logger.debug("Story status: %s", story_status)
+    if images:
+        logger.debug("Suggested %d images for the article", len(images))
+    
+    return {
+        'title': title,
+        'body': body,
+        'summary': summary,
+        'story_status': story_status,
+        'images': images
+    }
+
+def _placeholder_article_content(category: str) -> Dict[str, Any]:
+    """Return placeholder article content for when generating it fails."""
+    return {
+        'title': f"Placeholder Title for {category} Article",
+        'body': "This is a placeholder for the article body.",
+        'summary': "This is a placeholder summary.",
+        'story_status': 'ongoing',  # Default story status in case of error
+        'images': []  # Empty array for images in case of error
+    }
+
+def generate_article_content(
+    category: str,
+    author_info: Dict[str, Any],
+    article_town_data: Dict[str, Any] = None,
+    article_people_data: List[Dict[str, Any]] = None,
+    seriousness: str = "balanced",
+    config: Dict[str, Any] = None
+) -> Dict[str, str]:
+    """
+    Generate article title, body, and summary using the OpenAI API.
+    
+    Args:
+        category: The article category (e.g., Politics, Sports)
+        author_info: Information about the author including name, persona, and writing style
+        article_town_data: Optional town data to include in the article
+        article_people_data: Optional list of people data to include in the article
+        seriousness: The tone of the article from very_lighthearted to very_serious
+        config: Configuration data loaded from article_config.yaml
+        
+    Returns:
+        Dictionary containing the generated title, body, and summary
+    """
+    logger.debug("=== GENERATING ARTICLE CONTENT WITH OPENAI ===")
+    
+    # If config is not provided, load it
+    if config is None:
+        config = load_config(CONFIG_FILE)
+    
+    system_prompt, messages, model_args = _build_article_request(
+        category, author_info, article_town_data, article_people_data, seriousness, config
+    )
+    
     try:
-        # Call the OpenAI API
+        # Call the OpenAI API and parse the JSON response
         response_text = call_openai_api(system_prompt, messages, model_args)
-        
-        # Parse the JSON response
-        import json
-        response_data = json.loads(response_text)
-        
-        # Extract the article content
-        title = response_data.get('title', f"Article about {category}")
-        body = response_data.get('body', "No content generated.")
-        summary = response_data.get('summary', "No summary available.")
-        # Extract image suggestions (defaulting to empty list if not provided)
-        images = response_data.get('images', [])
-        # Extract story status (defaulting to "ongoing" if not provided)
-        story_status = response_data.get('story_status', "ongoing")
-        # Normalize story status to ensure it's either "ongoing" or "concluded"
-        story_status = story_status.lower().strip()
-        if story_status not in ["ongoing", "concluded"]:
-            story_status = "ongoing"  # Default if invalid value
-        
-        print(f"\nGenerated title: {title}")
-        print(f"\nSummary: {summary[:100]}...")
-        print(f"\nStory status: {story_status}")
-        if images:
-            print(f"\nSuggested {len(images)} images for the article")
-        
-        return {
-            'title': title,
-            'body': body,
-            'summary': summary,
-            'story_status': story_status,
-            'images': images
-        }
+        return _parse_article_content(category, response_text)
     except Exception as e:
-        print(f"\nError generating article content: {e}")
-        return {
-            'title': f"Placeholder Title for {category} Article",
-            'body': "This is a placeholder for the article body.",
-            'summary': "This is a placeholder summary.",
-            'story_status': 'ongoing',  # Default story status in case of error
-            'images': []  # Empty array for images in case of error
-        }
+        logger.error("Error generating article content: %s", e)
+        return _placeholder_article_content(category)
 
-def create_new_story():
+async def generate_article_content_async(
+    category: str,
+    author_info: Dict[str, Any],
+    article_town_data: Dict[str, Any] = None,
+    article_people_data: List[Dict[str, Any]] = None,
+    seriousness: str = "balanced",
+    config: Dict[str, Any] = None,
+    client: Optional[AsyncOpenAI] = None
+) -> Dict[str, str]:
     """
-    Create a new news story by sampling category and author from configuration.
-    The story will be saved to articles.csv.
+    Generate article title, body, and summary using the OpenAI API, without
+    blocking the event loop while waiting for the response.
+    
+    Takes the same arguments as generate_article_content, plus an optional
+    AsyncOpenAI client shared between the articles being generated.
     
     Returns:
-        Dict containing the generated article data
+        Dictionary containing the generated title, body, and summary
     """
-    # Get the directory of the current file
-    current_dir = Path(__file__).parent
-    data_dir = Path(current_dir).parent.parent.parent / 'data'
+    logger.debug("=== GENERATING ARTICLE CONTENT WITH OPENAI ===")
     
-    # Load configuration
-    config_file = current_dir / 'article_config.yaml'
-    config = load_config(config_file)
+    # If config is not provided, load it
+    if config is None:
+        config = load_config(CONFIG_FILE)
     
-    # Load town and people data
-    town_data_file = data_dir / 'town_data.json'
-    people_data_file = data_dir / 'people_data.csv'
+    system_prompt, messages, model_args = _build_article_request(
+        category, author_info, article_town_data, article_people_data, seriousness, config
+    )
     
-    town_data = load_town_data(town_data_file)
-    people_data = load_people_data(people_data_file)
+    try:
+        # Call the OpenAI API and parse the JSON response
+        response_text = await call_openai_api_async(system_prompt, messages, model_args, client=client)
+        return _parse_article_content(category, response_text)
+    except Exception as e:
+        logger.error("Error generating article content: %s", e)
+        return _placeholder_article_content(category)
+
+def _sample_story(config, town_data, people, people_by_age_group):
+    """
+    Sample the category, author, tone, and town and people data of a news
+    story from configuration.
     
+    Args:
+        config: Configuration data loaded from article_config.yaml
+        town_data: Town data loaded from town_data.json
+        people: Records of the people loaded from people_data.csv
+        people_by_age_group: Dict mapping age group labels to the records of
+                             the people in them
+        
+    Returns:
+        Dict describing the story, with the arguments for
+        generate_article_content under 'content_args'
+    """
     # Sample category
     category = random.choice(config['categories'])
     
-    # Find authors who specialize in this category if possible
-    category_authors = [
-        author for author in config['authors'] 
-        if category in author.get('specialties', [])
-    ]
-    
-    # If no author specializes in this category, choose any author
-    if not category_authors:
+    # Choose an author, with a higher chance (70%) of one specialized in this
+    # category, in a single draw using the precomputed weights
+    author_cum_weights = config['_author_cum_weights'].get(category)
+    if author_cum_weights is None:
+        # No author specializes in this category, choose any author
         author_info = random.choice(config['authors'])
     else:
-        # Higher chance (70%) of selecting an author specialized in this category
-        if random.random() < 0.7:
-            author_info = random.choice(category_authors)
-        else:
-            author_info = random.choice(config['authors'])
+        author_info = random.choices(config['authors'], cum_weights=author_cum_weights, k=1)[0]
     
-    # Extract author name and persona
     author_name = author_info['name']
-    author_persona = author_info['persona']
-    author_style = author_info['writing_style']
     
-    # Generate article ID (timestamp-based for uniqueness)
-    article_id = f"ART-{datetime.datetime.now().strftime('%Y%m%d%H%M%S')}"
+    # Timestamp the story once, it dates the ID and the publication fields
+    now = datetime.datetime.now()
+    
+    # Generate article ID, timestamp-based and numbered so that stories
+    # sampled in quick succession don't collide even if the clock hasn't moved
+    article_id = f"ART-{now:%Y%m%d%H%M%S%f}-{next(_ARTICLE_NUMBERS)}"
     
     # Sample data from town and people based on article_seed
     article_town_data = {}
@@ -264,16 +619,14 @@ def create_new_story():
     
     # Sample article seriousness level
     seriousness = "balanced"  # Default to balanced if not configured
-    if 'article_seed' in config and 'tone' in config['article_seed'] and 'seriousness' in config['article_seed']['tone']:
-        seriousness_weights = config['article_seed']['tone']['seriousness']
-        seriousness_levels = list(seriousness_weights.keys())
-        seriousness_probs = list(seriousness_weights.values())
-        seriousness = random.choices(seriousness_levels, weights=seriousness_probs, k=1)[0]
+    if config.get('_seriousness_choices'):
+        seriousness_levels, seriousness_cum_weights = config['_seriousness_choices']
+        seriousness = random.choices(seriousness_levels, cum_weights=seriousness_cum_weights, k=1)[0]
     
-    print(f"\n--- GENERATING ARTICLE {article_id} ---")
-    print(f"Category: {category}")
-    print(f"Author: {author_name} ({author_info['writing_style']})")
-    print(f"Tone: {seriousness.replace('_', ' ').title()}")
+    logger.info("--- GENERATING ARTICLE %s ---", article_id)
+    logger.info("Category: %s", category)
+    logger.info("Author: %s (%s)", author_name, author_info['writing_style'])
+    logger.info("Tone: %s", seriousness.replace('_', ' ').title())
     
     # Sample town data if available and according to article_seed
     if town_data and 'article_seed' in config and 'town_data' in config['article_seed']:
@@ -281,11 +634,11 @@ def create_new_story():
         
         # Check if we should include town data based on inclusion probability
         if random.random() < town_config.get('inclusion_probability', 0.5):
-            print(f"\n=== TOWN DATA SAMPLING ===")
-            print(f"Town: {town_data.get('name', 'Unknown')}")
-            print(f"Population: {town_data.get('population', 0)}")
-            print(f"Founded: {town_data.get('founded_year', 'Unknown')}")
-            print(f"Climate: {town_data.get('climate', 'Unknown')}")
+            logger.debug("=== TOWN DATA SAMPLING ===")
+            logger.debug("Town: %s", town_data.get('name', 'Unknown'))
+            logger.debug("Population: %s", town_data.get('population', 0))
+            logger.debug("Founded: %s", town_data.get('founded_year', 'Unknown'))
+            logger.debug("Climate: %s", town_data.get('climate', 'Unknown'))
             
             # Extract relevant town features based on feature weights
             feature_weights = town_config.get('feature_weights', {})
@@ -295,131 +648,100 @@ def create_new_story():
                 'town_features': {}
             }
             
-            # Sample streets
-            sampled_streets = []
-            if 'streets' in town_data and 'streets' in feature_weights:
-                street_config = feature_weights['streets']
-                if random.random() < street_config.get('probability', 0.5):
-                    max_streets = street_config.get('max_count', 3)
-                    num_streets = min(max_streets, len(town_data['streets']))
-                    if num_streets > 0:
-                        sampled_streets = random.sample(town_data['streets'], num_streets)
-                        article_town_data['town_features']['streets'] = sampled_streets
-                        
-                        print(f"\nSampled Streets (max: {max_streets}):")
-                        for street in sampled_streets:
-                            print(f"  - {street.get('name', 'Unknown Street')} ({street.get('type', 'Unknown Type')})")
-            
-            # Sample landmarks if present
-            sampled_landmarks = []
-            if 'landmarks' in town_data and 'landmarks' in feature_weights:
-                landmark_config = feature_weights['landmarks']
-                if random.random() < landmark_config.get('probability', 0.5):
-                    max_landmarks = landmark_config.get('max_count', 2)
-                    num_landmarks = min(max_landmarks, len(town_data.get('landmarks', [])))
-                    if num_landmarks > 0:
-                        sampled_landmarks = random.sample(town_data['landmarks'], num_landmarks)
-                        article_town_data['town_features']['landmarks'] = sampled_landmarks
-                        
-                        print(f"\nSampled Landmarks (max: {max_landmarks}):")
-                        for landmark in sampled_landmarks:
-                            print(f"  - {landmark.get('name', 'Unknown Landmark')} ({landmark.get('type', 'Unknown Type')})")
-                            print(f"    Located on: {landmark.get('street', 'Unknown Street')}")
-                            print(f"    Established: {landmark.get('established_year', 'Unknown')}")
-            
-            # Sample businesses if present
-            sampled_businesses = []
-            if 'businesses' in town_data and 'businesses' in feature_weights:
-                business_config = feature_weights['businesses']
-                if random.random() < business_config.get('probability', 0.5):
-                    max_businesses = business_config.get('max_count', 2)
-                    num_businesses = min(max_businesses, len(town_data.get('businesses', [])))
-                    if num_businesses > 0:
-                        sampled_businesses = random.sample(town_data['businesses'], num_businesses)
-                        article_town_data['town_features']['businesses'] = sampled_businesses
-                        
-                        print(f"\nSampled Businesses (max: {max_businesses}):")
-                        for business in sampled_businesses:
-                            print(f"  - {business.get('name', 'Unknown Business')} ({business.get('type', 'Unknown Type')})")
-                            print(f"    Located on: {business.get('street', 'Unknown Street')}")
-                            print(f"    Founded: {business.get('founded_year', 'Unknown')}")
-            
-            # Sample events if present
-            sampled_events = []
-            if 'events' in town_data and 'events' in feature_weights:
-                event_config = feature_weights['events']
-                if random.random() < event_config.get('probability', 0.5):
-                    max_events = event_config.get('max_count', 2)
-                    num_events = min(max_events, len(town_data.get('events', [])))
-                    if num_events > 0:
-                        sampled_events = random.sample(town_data['events'], num_events)
-                        article_town_data['town_features']['events'] = sampled_events
+            # Sample each kind of town feature
+            for feature, default_max_count, label, details in TOWN_FEATURE_SAMPLING:
+                if feature not in town_data or feature not in feature_weights:
+                    continue
+                
+                sample_config = feature_weights[feature]
+                if random.random() < sample_config.get('probability', 0.5):
+                    max_count = sample_config.get('max_count', default_max_count)
+                    num_items = min(max_count, len(town_data[feature]))
+                    if num_items > 0:
+                        sampled_items = _sample_k(town_data[feature], num_items)
+                        article_town_data['town_features'][feature] = sampled_items
                         
-                        print(f"\nSampled Events (max: {max_events}):")
-                        for event in sampled_events:
-                            print(f"  - {event.get('name', 'Unknown Event')} ({event.get('type', 'Unknown Type')})")
-                            print(f"    Date: {event.get('date', 'Unknown Date')}")
-                            print(f"    Location: {event.get('location', 'Unknown Location')}")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("Sampled %s (max: %s):", feature.title(), max_count)
+                            for item in sampled_items:
+                                logger.debug("  - %s (%s)", item.get('name', f'Unknown {label}'), item.get('type', 'Unknown Type'))
+                                for detail_label, key, default in details:
+                                    logger.debug("    %s: %s", detail_label, item.get(key, default))
     
     # Sample people data if available and according to article_seed
-    if not people_data.empty and 'article_seed' in config and 'people_data' in config['article_seed']:
+    if people and 'article_seed' in config and 'people_data' in config['article_seed']:
         people_config = config['article_seed']['people_data']
         
         # Check if we should include people data based on inclusion probability
         if random.random() < people_config.get('inclusion_probability', 0.5):
-            print(f"\n=== PEOPLE DATA SAMPLING ===")
+            logger.debug("=== PEOPLE DATA SAMPLING ===")
             
             # Determine how many people to include
             min_people = people_config.get('min_people_per_article', 1)
             max_people = people_config.get('max_people_per_article', 3)
             num_people = random.randint(min_people, max_people)
-            print(f"Target number of people to include: {num_people}")
+            logger.debug("Target number of people to include: %s", num_people)
             
             # Sample people
-            if len(people_data) > 0:
+            if len(people) > 0:
                 # Apply demographic filters if specified
-                filtered_people = people_data
+                filtered_people = people
                 chosen_age_group = "All ages"
                 
                 # Filter by age groups if specified
-                if 'demographic_weights' in people_config and 'age' in people_config['demographic_weights']:
-                    age_weights = people_config['demographic_weights']['age']
-                    
-                    # Choose an age group based on weights
-                    age_groups = list(age_weights.keys())
-                    age_probs = list(age_weights.values())
-                    chosen_age_group = random.choices(age_groups, weights=age_probs, k=1)[0]
-                    print(f"Selected age group: {chosen_age_group}")
+                if config.get('_age_group_choices'):
+                    # Choose an age group based on the precomputed weights
+                    age_groups, age_cum_weights = config['_age_group_choices']
+                    chosen_age_group = random.choices(age_groups, cum_weights=age_cum_weights, k=1)[0]
+                    logger.debug("Selected age group: %s", chosen_age_group)
                     
-                    # Apply age filter
-                    if chosen_age_group == "18-30":
-                        filtered_people = people_data[(people_data['age'] >= 18) & (people_data['age'] <= 30)]
-                    elif chosen_age_group == "31-50":
-                        filtered_people = people_data[(people_data['age'] >= 31) & (people_data['age'] <= 50)]
-                    elif chosen_age_group == "51-70":
-                        filtered_people = people_data[(people_data['age'] >= 51) & (people_data['age'] <= 70)]
-                    elif chosen_age_group == "71+":
-                        filtered_people = people_data[people_data['age'] >= 71]
+                    # Apply age filter using the precomputed age group slices
+                    filtered_people = people_by_age_group.get(chosen_age_group, people)
                 
                 # Sample from filtered people
-                if not filtered_people.empty:
+                if filtered_people:
                     sample_size = min(num_people, len(filtered_people))
-                    sampled_people = filtered_people.sample(sample_size)
-                    article_people_data = sampled_people.to_dict('records')
+                    # Copy the shared records so the article gets its own
+                    article_people_data = [dict(person) for person in _sample_k(filtered_people, sample_size)]
                     
-                    print(f"\nSampled {len(article_people_data)} people:")
-                    for i, person in enumerate(article_people_data):
-                        print(f"\nPerson {i+1}:")
-                        print(f"  Name: {person.get('first_name', '')} {person.get('last_name', '')}")
-                        print(f"  Age: {person.get('age', 'Unknown')}")
-                        print(f"  Occupation: {person.get('occupation', 'Unknown')}")
-                        print(f"  Location: {person.get('location', 'Unknown')}")
-                        print(f"  Temperament: {person.get('temperament_type', 'Unknown')} - {person.get('temperament_description', 'Unknown')}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Sampled %d people:", len(article_people_data))
+                        for i, person in enumerate(article_people_data):
+                            logger.debug("Person %d:", i + 1)
+                            logger.debug("  Name: %s %s", person.get('first_name', ''), person.get('last_name', ''))
+                            logger.debug("  Age: %s", person.get('age', 'Unknown'))
+                            logger.debug("  Occupation: %s", person.get('occupation', 'Unknown'))
+                            logger.debug("  Location: %s", person.get('location', 'Unknown'))
+                            logger.debug("  Temperament: %s - %s", person.get('temperament_type', 'Unknown'), person.get('temperament_description', 'Unknown'))
                 else:
-                    print("No people matched the demographic filters.")
+                    logger.debug("No people matched the demographic filters.")
     
-    # Generate article content using OpenAI
-    content = generate_article_content(category, author_info, article_town_data, article_people_data, seriousness, config)
+    return {
+        'article_id': article_id,
+        'timestamp': now,
+        'category': category,
+        'author_info': author_info,
+        'seriousness': seriousness,
+        'content_args': (category, author_info, article_town_data, article_people_data, seriousness, config),
+    }
+
+def _finish_story(story, content):
+    """
+    Find images for a sampled story's generated content and assemble its
+    article, without saving it.
+    
+    Args:
+        story: Story sampled by _sample_story
+        content: Article content returned by generate_article_content
+        
+    Returns:
+        Dict containing the generated article data
+    """
+    article_id = story['article_id']
+    now = story['timestamp']
+    category = story['category']
+    seriousness = story['seriousness']
+    author_info = story['author_info']
     
     # Get the generated image suggestions
     images = content.get('images', [])
@@ -429,7 +751,7 @@ def create_new_story():
     
     # Search for actual images based on the suggestions
     if images and len(images) > 0:
-        print("\n=== SEARCHING FOR ARTICLE IMAGES ===")
+        logger.debug("=== SEARCHING FOR ARTICLE IMAGES ===")
         images_with_urls = search_for_article_images(images)
     else:
         images_with_urls = []
@@ -440,15 +762,15 @@ def create_new_story():
     article = {
         'article_id': article_id,
         'title': content['title'],
-        'slug': content['title'].lower().replace(' ', '-').replace(',', '').replace('.', '').replace('\'', '').replace('"', '')[:50],
+        'slug': _SLUG_STRIP_PATTERN.sub('', content['title'].lower()).replace(' ', '-')[:50],
         'body': content['body'],
         'summary': content['summary'],
         'images': images_json,  # Add the images as a JSON string
-        'publication_date': datetime.datetime.now().strftime('%Y-%m-%d'),
-        'last_updated': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-        'author': author_name,
-        'author_persona': author_persona,
-        'author_style': author_style,
+        'publication_date': f"{now:%Y-%m-%d}",
+        'last_updated': f"{now:%Y-%m-%d %H:%M:%S}",
+        'author': author_info['name'],
+        'author_persona': author_info['persona'],
+        'author_style': author_info['writing_style'],
         'category': category,
         'status': 'Draft',
         'story_status': content.get('story_status', 'Ongoing'),  # Use the LLM-provided story status
@@ -456,67 +778,235 @@ def create_new_story():
         'parent_article_id': None,  # No parent article for new articles
     }
     
-    # Define the path to the CSV file in the data directory
-    csv_file = Path(current_dir).parent.parent.parent / 'data' / 'articles.csv'
-    
-    # Check if the file exists
-    file_exists = csv_file.is_file()
-    
-    # Define expected columns for the DataFrame
-    expected_columns = [
-        'article_id', 'title', 'slug', 'body', 'summary', 'images',
-        'publication_date', 'last_updated', 'author', 
-        'author_persona', 'author_style', 'category', 
-        'status', 'story_status', 'town_data', 'people_data',
-        'seriousness', 'parent_article_id'
-    ]
+    return article
+
+def _create_story(config, town_data, people, people_by_age_group):
+    """
+    Create a news story by sampling category and author from configuration,
+    without saving it.
     
-    # Convert the article dictionary to a DataFrame
-    article_df = pd.DataFrame([article])
+    Args:
+        config: Configuration data loaded from article_config.yaml
+        town_data: Town data loaded from town_data.json
+        people: Records of the people loaded from people_data.csv
+        people_by_age_group: Dict mapping age group labels to the records of
+                             the people in them
+        
+    Returns:
+        Dict containing the generated article data
+    """
+    story = _sample_story(config, town_data, people, people_by_age_group)
+    content = generate_article_content(*story['content_args'])
+    return _finish_story(story, content)
+
+def _save_articles(articles, csv_file):
+    """
+    Add articles to the articles CSV file, creating it or migrating it to the
+    expected columns as needed.
     
-    if file_exists:
+    Args:
+        articles: List of article dicts to save
+        csv_file: Path to the articles CSV file
+    """
+    # Only one batch of stories may touch the CSV file at a time
+    with _CSV_LOCK:
         try:
-            # Try to read the existing CSV file
-            existing_df = pd.read_csv(csv_file)
+            # Read just the header of the existing CSV file, if there is one,
+            # unless an earlier batch already checked this version of it
+            existing_columns = None
+            if csv_file.is_file():
+                stat = csv_file.stat()
+                if stat.st_size > 0:
+                    cached = _CSV_HEADERS.get(str(csv_file))
+                    if cached is not None and cached[0] == (stat.st_ino, stat.st_mtime_ns):
+                        existing_columns = cached[1]
+                    else:
+                        with open(csv_file, 'r', newline='', encoding='utf-8') as file:
+                            existing_columns = next(csv.reader(file), None)
+            
+            if not existing_columns:
+                # File doesn't exist or is empty, create it with a header
+                _close_csv_appender(csv_file)
+                with open(csv_file, 'w', newline='', encoding='utf-8') as file:
+                    writer = csv.DictWriter(file, fieldnames=ARTICLE_COLUMNS, restval='')
+                    writer.writeheader()
+                    writer.writerows(articles)
+                _remember_csv_header(csv_file, ARTICLE_COLUMNS)
             
-            # Check if the columns match
-            if set(existing_df.columns) != set(expected_columns):
-                print("CSV structure has changed. Creating backup and new file...")
+            elif set(existing_columns) != set(ARTICLE_COLUMNS):
+                logger.warning("CSV structure has changed. Creating backup and new file...")
+                _close_csv_appender(csv_file)
                 
-                # Create a backup
+                # Create a backup. The file is replaced below rather than
+                # modified in place, so a hardlink keeps the old contents
+                # without copying them
                 backup_file = f"{csv_file}.bak"
-                import shutil
-                shutil.copy2(csv_file, backup_file)
+                if os.path.lexists(backup_file):
+                    os.remove(backup_file)
+                try:
+                    os.link(csv_file, backup_file)
+                except OSError:
+                    shutil.copy2(csv_file, backup_file)
+                
+                # The full file is only needed when it has to be rewritten,
+                # and only then is pandas worth importing
+                import pandas as pd
+                existing_df = pd.read_csv(csv_file)
                 
                 # Ensure all columns are present in both DataFrames
-                for col in expected_columns:
+                for col in ARTICLE_COLUMNS:
                     if col not in existing_df.columns:
                         existing_df[col] = ""
                 
                 # Reorder and filter columns to match expected structure
-                existing_df = existing_df[expected_columns]
+                existing_df = existing_df[ARTICLE_COLUMNS]
                 
-                # Concatenate with the new article and save
+                # Concatenate with the new articles and save
+                article_df = pd.DataFrame(articles, columns=ARTICLE_COLUMNS)
                 updated_df = pd.concat([existing_df, article_df], ignore_index=True)
-                updated_df.to_csv(csv_file, index=False)
+                updated_file = f"{csv_file}.tmp"
+                updated_df.to_csv(updated_file, index=False)
+                os.replace(updated_file, csv_file)
+                _remember_csv_header(csv_file, ARTICLE_COLUMNS)
+            
             else:
-                # Append the new article
-                article_df.to_csv(csv_file, mode='a', header=False, index=False)
+                # Append the new articles, in the file's column order
+                _append_csv_rows(csv_file, existing_columns, articles)
+                _remember_csv_header(csv_file, existing_columns)
                 
-        except pd.errors.EmptyDataError:
-            # File exists but is empty
-            article_df.to_csv(csv_file, index=False)
-            
         except Exception as e:
             # Handle other errors (like permission issues)
-            print(f"Error processing CSV file: {e}")
-            # Try writing new file
-            article_df.to_csv(csv_file, index=False)
-    else:
-        # File doesn't exist, create it
-        article_df.to_csv(csv_file, index=False)
+            logger.error("Error processing CSV file: %s", e)
+
+def _remember_csv_header(csv_file, columns):
+    """Remember the columns just written to a CSV file, for its current version."""
+    stat = os.stat(csv_file)
+    _CSV_HEADERS[str(csv_file)] = ((stat.st_ino, stat.st_mtime_ns), columns)
+
+def create_stories(n):
+    """
+    Create several new news stories, loading the configuration and data once
+    and saving the stories to articles.csv in a single write.
+    
+    A story that fails is logged and left out, the others are still saved.
+    
+    Args:
+        n: Number of stories to create
+        
+    Returns:
+        List of dicts containing the generated article data
+    """
+    # Load configuration
+    config = load_config(CONFIG_FILE)
+    
+    # Load town and people data
+    town_data = load_town_data(TOWN_DATA_FILE)
+    people, people_by_age_group = _load_people(PEOPLE_DATA_FILE)
+    
+    articles = []
+    for _ in range(n):
+        try:
+            articles.append(_create_story(config, town_data, people, people_by_age_group))
+        except Exception as e:
+            logger.error("Error creating article: %s", e)
+    
+    # Save the stories to the CSV file in the data directory
+    if articles:
+        _save_articles(articles, ARTICLES_CSV_FILE)
+    
+    for article in articles:
+        logger.info("Created new article with ID: %s", article['article_id'])
+    return articles
+
+async def create_stories_async(n, max_concurrency=DEFAULT_MAX_CONCURRENCY):
+    """
+    Create several new news stories, generating their content with
+    concurrent OpenAI requests, and save them to articles.csv in a single
+    write.
+    
+    A story that fails is logged and left out, the others are still saved.
+    
+    Args:
+        n: Number of stories to create
+        max_concurrency: Maximum number of stories being generated at once
+        
+    Returns:
+        List of dicts containing the generated article data
+    """
+    # Load configuration
+    config = load_config(CONFIG_FILE)
     
-    print(f"Created new article with ID: {article_id}")
+    # Load town and people data
+    town_data = load_town_data(TOWN_DATA_FILE)
+    people, people_by_age_group = _load_people(PEOPLE_DATA_FILE)
+    
+    stories = []
+    for _ in range(n):
+        try:
+            stories.append(_sample_story(config, town_data, people, people_by_age_group))
+        except Exception as e:
+            logger.error("Error sampling article: %s", e)
+    
+    # Share one client between the requests, if one can be created. Otherwise
+    # each request fails and the stories fall back to placeholder content
+    try:
+        client = initialize_async_openai_client()
+    except Exception as e:
+        logger.error("Error initializing OpenAI client: %s", e)
+        client = None
+    
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    
+    async def generate(story):
+        async with semaphore:
+            try:
+                content = await generate_article_content_async(*story['content_args'], client=client)
+                # The image searches block, run them in a thread so other
+                # stories' requests carry on meanwhile (the searches
+                # themselves are rate limited across threads)
+                return await asyncio.to_thread(_finish_story, story, content)
+            except Exception as e:
+                logger.error("Error creating article %s: %s", story['article_id'], e)
+                return None
+    
+    try:
+        results = await asyncio.gather(*(generate(story) for story in stories))
+    finally:
+        if client is not None:
+            await client.close()
+    
+    articles = [article for article in results if article is not None]
+    
+    # Save the stories to the CSV file in the data directory
+    if articles:
+        _save_articles(articles, ARTICLES_CSV_FILE)
+    
+    for article in articles:
+        logger.info("Created new article with ID: %s", article['article_id'])
+    return articles
+
+def create_new_story():
+    """
+    Create a new news story by sampling category and author from configuration.
+    The story will be saved to articles.csv.
+    
+    Returns:
+        Dict containing the generated article data
+    """
+    # Load configuration
+    config = load_config(CONFIG_FILE)
+    
+    # Load town and people data
+    town_data = load_town_data(TOWN_DATA_FILE)
+    people, people_by_age_group = _load_people(PEOPLE_DATA_FILE)
+    
+    # Unlike create_stories, let a failure reach the caller
+    article = _create_story(config, town_data, people, people_by_age_group)
+    
+    # Save the story to the CSV file in the data directory
+    _save_articles([article], ARTICLES_CSV_FILE)
+    
+    logger.info("Created new article with ID: %s", article['article_id'])
     return article
 
 def search_for_image(query: str, credentials_path: Optional[str] = None) -> Dict[str, str]:
@@ -540,24 +1030,24 @@ def search_for_image(query: str, credentials_path: Optional[str] = None) -> Dict
                 creds = json.load(file)
                 api_key = creds.get('UNSPLASH_ACCESS_KEY')
         except (FileNotFoundError, json.JSONDecodeError) as e:
-            print(f"Error loading credentials: {e}")
+            logger.error("Error loading credentials: %s", e)
     
     # If still no API key, try default location
     if not api_key:
-        default_creds_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), 'credentials')
-        print(f"Looking for credentials file at: {default_creds_path}")
+        default_creds_path = PROJECT_ROOT / 'credentials'
+        logger.debug("Looking for credentials file at: %s", default_creds_path)
         try:
             with open(default_creds_path, 'r') as file:
                 creds = json.load(file)
                 api_key = creds.get('UNSPLASH_ACCESS_KEY')
                 if api_key:
-                    print("Found Unsplash API key in credentials file")
+                    logger.debug("Found Unsplash API key in credentials file")
         except (FileNotFoundError, json.JSONDecodeError) as e:
-            print(f"Error loading default credentials: {e}")
+            logger.error("Error loading default credentials: %s", e)
     
     # If no API key is available, fall back to a placeholder
     if not api_key:
-        print("No Unsplash API key found. Using placeholder image.")
+        logger.warning("No Unsplash API key found. Using placeholder image.")
         return {
             "url": f"https://via.placeholder.com/800x600?text={query.replace(' ', '+')}",
             "alt_text": query,
@@ -599,7 +1089,7 @@ def search_for_image(query: str, credentials_path: Optional[str] = None) -> Dict
                 "search_query": query
             }
         else:
-            print(f"No image results found for query: {query}")
+            logger.warning("No image results found for query: %s", query)
             return {
                 "url": f"https://via.placeholder.com/800x600?text={query.replace(' ', '+')}",
                 "alt_text": query,
@@ -609,7 +1099,7 @@ def search_for_image(query: str, credentials_path: Optional[str] = None) -> Dict
             }
             
     except Exception as e:
-        print(f"Error searching for image: {e}")
+        logger.error("Error searching for image: %s", e)
         # Return a placeholder image as fallback
         return {
             "url": f"https://via.placeholder.com/800x600?text={query.replace(' ', '+')}",
@@ -619,6 +1109,19 @@ def search_for_image(query: str, credentials_path: Optional[str] = None) -> Dict
             "search_query": query
         }
 
+def _wait_for_image_search():
+    """
+    Wait until IMAGE_SEARCH_INTERVAL has passed since the previous image
+    search made by any thread, and claim the next slot.
+    """
+    with _IMAGE_SEARCH_LOCK:
+        last = _LAST_IMAGE_SEARCH["time"]
+        if last is not None:
+            delay = last + IMAGE_SEARCH_INTERVAL - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+        _LAST_IMAGE_SEARCH["time"] = time.monotonic()
+
 def search_for_article_images(article_images: List[Dict[str, str]], credentials_path: Optional[str] = None) -> List[Dict[str, str]]:
     """
     Search for all images needed for an article.
@@ -633,13 +1136,11 @@ def search_for_article_images(article_images: List[Dict[str, str]], credentials_
     enhanced_images = []
     
     for i, img in enumerate(article_images):
-        print(f"\nSearching for image {i+1}/{len(article_images)}: {img['image']}")
+        logger.debug("Searching for image %d/%d: %s", i + 1, len(article_images), img['image'])
         
-        # Rate limiting to avoid API throttling
-        if i > 0:
-            time.sleep(1)  # Wait 1 second between requests
-            
-        # Get image info from search
+        # Get image info from search, rate limited across all stories to
+        # avoid API throttling
+        _wait_for_image_search()
         image_info = search_for_image(img['image'], credentials_path)
         
         # Create enhanced image object with original data plus search results
@@ -653,4 +1154,5 @@ def search_for_article_images(article_images: List[Dict[str, str]], credentials_
     return enhanced_images
 
 if __name__ == "__main__":
-    create_new_story()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    asyncio.run(create_stories_async(1))
@@ -40,13 +40,177 @@ Functions:
 import random
 import csv
 import os
+import multiprocessing
 import json
 import yaml
+from bisect import bisect_right
 from datetime import datetime
-from typing import List, Dict, Optional, Any
-import uuid
+from itertools import accumulate
+from types import MappingProxyType
+from typing import List, Dict, Optional, Any, Iterator
 from faker import Faker
 
+# Columns of the people CSV, in the order of generate_person_row's values
+FIELDNAMES = (
+    "id", "first_name", "last_name", "age", "gender", "birth_year",
+    "marital_status", "education_level", "employment_status", "occupation",
+    "annual_income", "household_size", "location", "full_address",
+    "phone_number", "email", "temperament_type", "temperament_description",
+    "temperament_traits", "country", "locale"
+)
+
+# Fallback tables for settings missing from people_config.yaml, shared by
+# every generator rather than rebuilt for each one
+DEFAULT_EDUCATION_LEVELS = (
+    "Less than high school",
+    "High school diploma/GED",
+    "Some college, no degree",
+    "Associate degree",
+    "Bachelor's degree",
+    "Master's degree",
+    "Professional degree",
+    "Doctoral degree"
+)
+
+# Employment status (universal across locales)
+DEFAULT_EMPLOYMENT_STATUS = (
+    "Employed full-time",
+    "Employed part-time",
+    "Unemployed",
+    "Retired",
+    "Student",
+    "Homemaker",
+    "Disabled",
+    "Self-employed"
+)
+
+# Marital status (universal across locales)
+DEFAULT_MARITAL_STATUS = (
+    "Single",
+    "Married",
+    "Divorced",
+    "Widowed",
+    "Separated",
+    "Domestic partnership"
+)
+
+# Temperament types with descriptions
+DEFAULT_TEMPERAMENTS = (
+    MappingProxyType({
+        "type": "Optimistic",
+        "description": "Generally positive outlook, sees the good in situations",
+        "traits": ("positive", "hopeful", "cheerful")
+    }),
+)
+
+# Locale-specific country name mapping
+DEFAULT_COUNTRY_MAPPING = MappingProxyType({
+    "en_US": "United States",
+    "en_GB": "United Kingdom",
+    "en_CA": "Canada",
+    "fr_FR": "France",
+    "de_DE": "Germany",
+    "es_ES": "Spain",
+    "it_IT": "Italy",
+    "pt_BR": "Brazil",
+    "ja_JP": "Japan",
+    "ko_KR": "South Korea",
+    "zh_CN": "China",
+    "ru_RU": "Russia",
+    "ar_SA": "Saudi Arabia",
+    "hi_IN": "India",
+    "nl_NL": "Netherlands",
+    "sv_SE": "Sweden",
+    "no_NO": "Norway",
+    "da_DK": "Denmark",
+    "fi_FI": "Finland",
+    "pl_PL": "Poland"
+})
+
+# Commonly used Faker locales
+DEFAULT_AVAILABLE_LOCALES = tuple(DEFAULT_COUNTRY_MAPPING)
+
+# Base annual income by education level
+EDUCATION_BASE_INCOME = MappingProxyType({
+    "Less than high school": 25000,
+    "High school diploma/GED": 35000,
+    "Some college, no degree": 40000,
+    "Associate degree": 45000,
+    "Bachelor's degree": 60000,
+    "Master's degree": 75000,
+    "Professional degree": 100000,
+    "Doctoral degree": 90000
+})
+
+# Configuration file of the people generator
+CONFIG_FILE = os.path.join(os.path.dirname(__file__), 'people_config.yaml')
+
+# Prefer the libyaml-backed loader, falling back to the pure Python one
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Parsed files keyed by path, as (mtime_ns, data) tuples
+_FILE_CACHE = {}
+
+
+def _load_cached(file_path: str, parse) -> Any:
+    """
+    Parse a file, reusing the previous result while its mtime is unchanged.
+    
+    Args:
+        file_path (str): Path to the file.
+        parse: Function taking the open file and returning the parsed data.
+        
+    Returns:
+        Any: The parsed data (shared between callers, so it must not be modified).
+    """
+    mtime = os.stat(file_path).st_mtime_ns
+    cached = _FILE_CACHE.get(file_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    with open(file_path, 'r', encoding='utf-8') as f:
+        data = parse(f)
+    _FILE_CACHE[file_path] = (mtime, data)
+    return data
+
+
+def _parse_config(f) -> Dict[str, Any]:
+    """Parse people_config.yaml."""
+    return yaml.load(f, Loader=SafeLoader)
+
+
+def _parse_street_names(f) -> tuple:
+    """Extract the street names from town_data.json."""
+    town_data = json.load(f)
+    
+    street_names = []
+    if 'streets' in town_data and isinstance(town_data['streets'], list):
+        for street in town_data['streets']:
+            if isinstance(street, dict) and 'name' in street:
+                street_names.append(street['name'])
+    return tuple(street_names)
+
+
+# Columns of the people CSV that generate_person_row leaves as integers
+NUMERIC_FIELDS = ("age", "birth_year", "annual_income", "household_size")
+
+
+def _row_to_person(row: tuple) -> Dict[str, str]:
+    """Convert a row from generate_person_row to a demographic record."""
+    person = dict(zip(FIELDNAMES, row))
+    for field in NUMERIC_FIELDS:
+        person[field] = str(person[field])
+    return person
+
+
+# Number of people a worker process generates per task when a dataset is
+# generated in parallel. It is fixed so that a seeded dataset comes out the
+# same whatever the number of workers.
+WORKER_CHUNK_SIZE = 250
+
 
 class PeopleGenerator:
     """
@@ -66,14 +230,36 @@ class PeopleGenerator:
         # Load configuration from YAML file
         self.config = self._load_config()
         
-        if seed is not None:
-            random.seed(seed)
-            Faker.seed(seed)
-        
         # Initialize Faker with specified locale
         self.fake = Faker(locale)
         self.locale = locale
         
+        # Draw from random generators of the instance's own, so seeding one
+        # generator doesn't reseed the random module or other Faker instances
+        self.seed = seed
+        self._rng = random.Random()
+        self.reseed(seed)
+        
+        # Bind the Faker methods called for every person once, instead of
+        # going through the Faker proxy's attribute lookup on every call
+        self._first_name_male = self.fake.first_name_male
+        self._first_name_female = self.fake.first_name_female
+        self._last_name = self.fake.last_name
+        self._job = self.fake.job
+        self._phone_number = self.fake.phone_number
+        self._email = self.fake.email
+        self._city = self.fake.city
+        self._postcode = self.fake.postcode if hasattr(self.fake, 'postcode') else self.fake.zipcode
+        self._address = self.fake.address
+        
+        # Generate the location from the most specific part of an address the locale has
+        if hasattr(self.fake, 'state'):
+            self._location = self.fake.state
+        elif hasattr(self.fake, 'city'):
+            self._location = self.fake.city
+        else:
+            self._location = lambda: self._address().partition('\n')[0]  # First line of address
+        
         # Load street names from town_data.json if available
         self.street_names = self._load_street_names()
         
@@ -100,65 +286,31 @@ class PeopleGenerator:
         self.NORMAL_EARNING_MULTIPLIER = income_age_multipliers.get('normal_earning_multiplier', 1.0)
         self.REDUCED_EARNING_MULTIPLIER = income_age_multipliers.get('reduced_earning_multiplier', 0.8)
         
-        # Load lists from config
-        self.education_levels = self.config.get('education_levels', [
-            "Less than high school",
-            "High school diploma/GED"]) 
-        
-        # Employment status (universal across locales)
-        self.employment_status = self.config.get('employment_status', [
-            "Employed full-time",
-            "Employed part-time",
-            "Unemployed",
-            "Retired",
-            "Student",
-            "Homemaker",
-            "Disabled",
-            "Self-employed"
-        ])
-        
-        # Marital status (universal across locales)
-        self.marital_status = self.config.get('marital_status', [
-            "Single",
-            "Married",
-            "Divorced",
-            "Widowed",
-            "Separated",
-            "Domestic partnership"
-        ])
-        
-        # Temperament types with descriptions
-        self.temperaments = self.config.get('temperaments', [
-            {
-                "type": "Optimistic",
-                "description": "Generally positive outlook, sees the good in situations",
-                "traits": ["positive", "hopeful", "cheerful"]
-            }
-        ])
-        
-        # Locale-specific country name mapping
-        self.country_mapping = self.config.get('country_mapping', {
-            "en_US": "United States",
-            "en_GB": "United Kingdom",
-            "en_CA": "Canada",
-            "fr_FR": "France",
-            "de_DE": "Germany",
-            "es_ES": "Spain",
-            "it_IT": "Italy",
-            "pt_BR": "Brazil",
-            "ja_JP": "Japan",
-            "ko_KR": "South Korea",
-            "zh_CN": "China",
-            "ru_RU": "Russia",
-            "ar_SA": "Saudi Arabia",
-            "hi_IN": "India",
-            "nl_NL": "Netherlands",
-            "sv_SE": "Sweden",
-            "no_NO": "Norway",
-            "da_DK": "Denmark",
-            "fi_FI": "Finland",
-            "pl_PL": "Poland"
-        })
+        # Load lists from config, falling back to the module's defaults
+        self.education_levels = self.config.get('education_levels', DEFAULT_EDUCATION_LEVELS)
+        self.employment_status = self.config.get('employment_status', DEFAULT_EMPLOYMENT_STATUS)
+        self.marital_status = self.config.get('marital_status', DEFAULT_MARITAL_STATUS)
+        self.temperaments = self.config.get('temperaments', DEFAULT_TEMPERAMENTS)
+        self.country_mapping = self.config.get('country_mapping', DEFAULT_COUNTRY_MAPPING)
+        self._country = self.country_mapping.get(self.locale, self.locale.split('_')[-1])
+        
+        self._build_weighted_choices()
+        
+        # Output fields of each temperament, with its traits already joined
+        self._temperament_fields = tuple(
+            (temperament["type"], temperament["description"], ", ".join(temperament["traits"]))
+            for temperament in self.temperaments
+        )
+        
+        # Year the birth years are worked out from, refreshed for each dataset
+        self._current_year = datetime.now().year
+        
+        # Tags of the education levels and employment statuses seen so far
+        self._education_tags = {}
+        self._employment_tags = {}
+        
+        # Cumulative temperament weights, keyed by (age, education, employment)
+        self._temperament_cum_weights = {}
     
     def _load_config(self) -> Dict[str, Any]:
         """
@@ -168,11 +320,7 @@ class PeopleGenerator:
             Dict[str, Any]: Configuration dictionary.
         """
         try:
-            # First try to load from the current directory
-            config_path = os.path.join(os.path.dirname(__file__), 'people_config.yaml')
-            
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+            return _load_cached(CONFIG_FILE, _parse_config)
         except (FileNotFoundError, yaml.YAMLError) as e:
             print(f"Warning: Could not load people_config.yaml: {e}")
             return {}
@@ -187,41 +335,18 @@ class PeopleGenerator:
         """
         try:
             # Try to load from config file
-            config_path = os.path.join(os.path.dirname(__file__), 'people_config.yaml')
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
-                if 'available_locales' in config:
-                    return config['available_locales']
+            config = _load_cached(CONFIG_FILE, _parse_config)
+            if 'available_locales' in config:
+                return list(config['available_locales'])
         except (FileNotFoundError, yaml.YAMLError):
             # Fall back to hardcoded values
             pass
             
-        return [
-            "en_US",  # United States
-            "en_GB",  # United Kingdom
-            "en_CA",  # Canada
-            "fr_FR",  # France
-            "de_DE",  # Germany
-            "es_ES",  # Spain
-            "it_IT",  # Italy
-            "pt_BR",  # Brazil
-            "ja_JP",  # Japan
-            "ko_KR",  # South Korea
-            "zh_CN",  # China
-            "ru_RU",  # Russia
-            "ar_SA",  # Saudi Arabia
-            "hi_IN",  # India
-            "nl_NL",  # Netherlands
-            "sv_SE",  # Sweden
-            "no_NO",  # Norway
-            "da_DK",  # Denmark
-            "fi_FI",  # Finland
-            "pl_PL"   # Poland
-        ]
+        return list(DEFAULT_AVAILABLE_LOCALES)
     
     def get_country_name(self) -> str:
         """Get the country name for the current locale."""
-        return self.country_mapping.get(self.locale, self.locale.split('_')[-1])
+        return self._country
     
     def generate_person(self) -> Dict[str, str]:
         """
@@ -230,26 +355,36 @@ class PeopleGenerator:
         Returns:
             Dict[str, str]: Dictionary containing demographic information.
         """
+        return _row_to_person(self.generate_person_row())
+    
+    def generate_person_row(self) -> tuple:
+        """
+        Generate a single person with demographic data, as a row of values in
+        the order of FIELDNAMES. The NUMERIC_FIELDS are left as integers for
+        the CSV writer to format.
+        
+        Returns:
+            tuple: The person's demographic information.
+        """
         # Generate basic demographics using Faker
-        gender = random.choice(["Male", "Female"])
+        gender = self._rng.choice(["Male", "Female"])
         if gender == "Male":
-            first_name = self.fake.first_name_male()
+            first_name = self._first_name_male()
         else:
-            first_name = self.fake.first_name_female()
+            first_name = self._first_name_female()
         
-        last_name = self.fake.last_name()
+        last_name = self._last_name()
         
         # Generate age (weighted towards working age population)
         age = self._generate_weighted_age()
         
         # Generate birth year
-        current_year = datetime.now().year
-        birth_year = current_year - age
+        birth_year = self._current_year - age
         
         # Generate other demographics using Faker where possible
         education = self._generate_weighted_education(age)
         employment = self._generate_weighted_employment(age)
-        occupation = self.fake.job() if "Employed" in employment else ""
+        occupation = self._job() if "Employed" in self._get_employment_tags(employment) else ""
         
         # Generate income based on education and employment
         income = self._generate_income(education, employment, age)
@@ -261,153 +396,213 @@ class PeopleGenerator:
         marital = self._generate_weighted_marital_status(age)
         
         # Generate location using Faker
-        if hasattr(self.fake, 'state'):
-            location = self.fake.state()
-        elif hasattr(self.fake, 'city'):
-            location = self.fake.city()
-        else:
-            location = self.fake.address().split('\n')[0]  # First line of address
+        location = self._location()
         
         # Generate full address
         address = self._generate_address_with_town_streets()
         
         # Generate phone number
-        phone = self.fake.phone_number()
+        phone = self._phone_number()
         
         # Generate email
-        email = self.fake.email()
+        email = self._email()
         
         # Generate temperament
-        temperament = self._generate_temperament(age, education, employment)
-        
-        # Generate unique ID
-        person_id = str(uuid.uuid4())[:8]
-        
-        return {
-            "id": person_id,
-            "first_name": first_name,
-            "last_name": last_name,
-            "age": str(age),
-            "gender": gender,
-            "birth_year": str(birth_year),
-            "marital_status": marital,
-            "education_level": education,
-            "employment_status": employment,
-            "occupation": occupation,
-            "annual_income": str(income),
-            "household_size": str(household_size),
-            "location": location,
-            "full_address": address,
-            "phone_number": phone,
-            "email": email,
-            "temperament_type": temperament["type"],
-            "temperament_description": temperament["description"],
-            "temperament_traits": ", ".join(temperament["traits"]),
-            "country": self.get_country_name(),
-            "locale": self.locale
-        }
+        temperament_type, temperament_description, temperament_traits = self._generate_temperament(age, education, employment)
+        
+        # Generate unique ID from the (possibly seeded) random generator
+        person_id = format(self._rng.getrandbits(32), '08x')
+        
+        return (
+            person_id,
+            first_name,
+            last_name,
+            age,
+            gender,
+            birth_year,
+            marital,
+            education,
+            employment,
+            occupation,
+            income,
+            household_size,
+            location,
+            address,
+            phone,
+            email,
+            temperament_type,
+            temperament_description,
+            temperament_traits,
+            self._country,
+            self.locale
+        )
     
-    def _generate_weighted_age(self) -> int:
-        """Generate age with realistic distribution."""
-        # Weight towards working age population (25-65)
-        weights = []
+    def _build_weighted_choices(self) -> None:
+        """
+        Precompute the choices and cumulative weights of the weighted draws
+        made for every person, so they aren't rebuilt on each call.
+        """
+        # Weight ages towards working age population (25-65)
         ages = list(range(self.MIN_AGE, self.MAX_AGE + 1))
-        
+        age_weights = []
         for age in ages:
             if self.WORKING_AGE_START <= age <= self.WORKING_AGE_END:
-                weights.append(3)  # Higher weight for working age
+                age_weights.append(3)  # Higher weight for working age
             elif self.MIN_AGE <= age <= 24 or 66 <= age <= 75:
-                weights.append(2)  # Medium weight
+                age_weights.append(2)  # Medium weight
             else:
-                weights.append(1)  # Lower weight for very young/old
+                age_weights.append(1)  # Lower weight for very young/old
+        self._age_choices = self._weighted_table(ages, age_weights)
+        
+        # Education by age: under 25, under 40, and older
+        self._education_choices = (
+            # Younger people less likely to have advanced degrees (up to bachelor's)
+            self._weighted_table(self.education_levels[:5], [15, 30, 25, 15, 15]),
+            # Prime education completion age
+            self._weighted_table(self.education_levels, [5, 20, 15, 15, 25, 15, 3, 2]),
+            # Older generation with different education patterns
+            self._weighted_table(self.education_levels, [10, 25, 20, 15, 20, 8, 1, 1]),
+        )
+        
+        # Employment by age: before working age, before retirement, and retired
+        self._employment_choices = (
+            self._weighted_table(self.employment_status, [40, 30, 15, 0, 10, 3, 1, 1]),
+            self._weighted_table(self.employment_status, [60, 15, 8, 2, 2, 5, 3, 5]),
+            self._weighted_table(self.employment_status, [10, 10, 2, 70, 0, 3, 3, 2]),
+        )
         
-        return random.choices(ages, weights=weights)[0]
+        # Marital status by age: under 25, under 40, under 65, and older
+        self._marital_choices = (
+            self._weighted_table(self.marital_status, [70, 25, 2, 1, 1, 1]),
+            self._weighted_table(self.marital_status, [35, 50, 8, 2, 3, 2]),
+            self._weighted_table(self.marital_status, [20, 60, 12, 3, 3, 2]),
+            self._weighted_table(self.marital_status, [15, 50, 10, 20, 3, 2]),
+        )
+        
+        # Household size by age: under 30, under 50, and older
+        self._household_choices = (
+            self._weighted_table([1, 2, 3, 4], [40, 35, 20, 5]),
+            self._weighted_table([1, 2, 3, 4, 5], [20, 30, 30, 15, 5]),
+            self._weighted_table([1, 2, 3], [30, 50, 20]),
+        )
+    
+    @staticmethod
+    def _weighted_table(choices, weights) -> tuple:
+        """
+        Build the (choices, cumulative weights) table _pick draws from.
+        
+        Raises:
+            ValueError: If the number of weights doesn't match the choices.
+        """
+        if len(weights) != len(choices):
+            raise ValueError(f"The number of weights does not match the choices: {list(choices)}")
+        return choices, list(accumulate(weights))
+    
+    def reseed(self, seed) -> None:
+        """
+        Seed the random generators the person data is drawn from.
+        
+        Args:
+            seed: Seed for reproducible results, or None to seed from the OS.
+        """
+        self._rng.seed(seed)
+        self.fake.seed_instance(seed)
+    
+    def _pick(self, choices, cum_weights):
+        """
+        Pick one of the choices by its cumulative weights. This makes the same
+        draw as random.choices(choices, cum_weights=cum_weights)[0] without
+        its argument handling.
+        """
+        return choices[bisect_right(cum_weights, self._rng.random() * cum_weights[-1], 0, len(choices) - 1)]
+    
+    def _generate_weighted_age(self) -> int:
+        """Generate age with realistic distribution."""
+        ages, cum_weights = self._age_choices
+        return self._pick(ages, cum_weights)
     
     def _generate_weighted_education(self, age: int) -> str:
         """Generate education level based on age."""
         if age < 25:
-            # Younger people less likely to have advanced degrees
-            return random.choices(
-                self.education_levels[:5],  # Up to bachelor's
-                weights=[15, 30, 25, 15, 15]
-            )[0]
+            levels, cum_weights = self._education_choices[0]
         elif age < 40:
-            # Prime education completion age
-            return random.choices(
-                self.education_levels,
-                weights=[5, 20, 15, 15, 25, 15, 3, 2]
-            )[0]
+            levels, cum_weights = self._education_choices[1]
         else:
-            # Older generation with different education patterns
-            return random.choices(
-                self.education_levels,
-                weights=[10, 25, 20, 15, 20, 8, 1, 1]
-            )[0]
+            levels, cum_weights = self._education_choices[2]
+        return self._pick(levels, cum_weights)
     
     def _generate_weighted_employment(self, age: int) -> str:
         """Generate employment status based on age."""
         if age < self.WORKING_AGE_START:
-            return random.choices(
-                self.employment_status,
-                weights=[40, 30, 15, 0, 10, 3, 1, 1]
-            )[0]
+            statuses, cum_weights = self._employment_choices[0]
         elif age < self.RETIREMENT_AGE:
-            return random.choices(
-                self.employment_status,
-                weights=[60, 15, 8, 2, 2, 5, 3, 5]
-            )[0]
+            statuses, cum_weights = self._employment_choices[1]
         else:
-            return random.choices(
-                self.employment_status,
-                weights=[10, 10, 2, 70, 0, 3, 3, 2]
-            )[0]
+            statuses, cum_weights = self._employment_choices[2]
+        return self._pick(statuses, cum_weights)
     
     def _generate_weighted_marital_status(self, age: int) -> str:
         """Generate marital status based on age."""
         if age < 25:
-            return random.choices(
-                self.marital_status,
-                weights=[70, 25, 2, 1, 1, 1]
-            )[0]
+            statuses, cum_weights = self._marital_choices[0]
         elif age < 40:
-            return random.choices(
-                self.marital_status,
-                weights=[35, 50, 8, 2, 3, 2]
-            )[0]
+            statuses, cum_weights = self._marital_choices[1]
         elif age < 65:
-            return random.choices(
-                self.marital_status,
-                weights=[20, 60, 12, 3, 3, 2]
-            )[0]
+            statuses, cum_weights = self._marital_choices[2]
         else:
-            return random.choices(
-                self.marital_status,
-                weights=[15, 50, 10, 20, 3, 2]
-            )[0]
+            statuses, cum_weights = self._marital_choices[3]
+        return self._pick(statuses, cum_weights)
+    
+    def _get_education_tags(self, education: str) -> frozenset:
+        """
+        Get the groups an education level belongs to ("has_degree",
+        "advanced_degree", "bachelor_or_masters"), working them out from the
+        label the first time it is seen.
+        """
+        tags = self._education_tags.get(education)
+        if tags is None:
+            tags = set()
+            if "degree" in education.lower():
+                tags.add("has_degree")
+            if any(level in education for level in ["Master's", "Doctoral", "Professional"]):
+                tags.add("advanced_degree")
+            if any(level in education for level in ["Bachelor's", "Master's"]):
+                tags.add("bachelor_or_masters")
+            tags = self._education_tags[education] = frozenset(tags)
+        return tags
+    
+    def _get_employment_tags(self, employment: str) -> frozenset:
+        """
+        Get the groups an employment status belongs to ("Employed",
+        "part-time", "Unemployed", "Student", "Retired", "Disabled",
+        "management_sales_law", "unemployment_disability"), working them out
+        from the label the first time it is seen.
+        """
+        tags = self._employment_tags.get(employment)
+        if tags is None:
+            tags = {status for status in ["Employed", "part-time", "Unemployed", "Student", "Retired", "Disabled"]
+                    if status in employment}
+            if any(job in employment for job in ["Manager", "Sales", "Lawyer"]):
+                tags.add("management_sales_law")
+            if "Unemployed" in tags or "Disabled" in tags:
+                tags.add("unemployment_disability")
+            tags = self._employment_tags[employment] = frozenset(tags)
+        return tags
     
     def _generate_income(self, education: str, employment: str, age: int) -> int:
         """Generate income based on education, employment, and age."""
+        employment_tags = self._get_employment_tags(employment)
+        
         # Handle special employment cases
-        if "Unemployed" in employment or "Student" in employment:
-            return random.randint(self.MIN_INCOME, self.UNEMPLOYED_MAX_INCOME)
-        elif "Retired" in employment:
-            return random.randint(self.RETIRED_MIN_INCOME, self.RETIRED_MAX_INCOME)
-        elif "part-time" in employment:
-            return random.randint(self.PART_TIME_MIN_INCOME, self.PART_TIME_MAX_INCOME)
+        if "Unemployed" in employment_tags or "Student" in employment_tags:
+            return self._rng.randint(self.MIN_INCOME, self.UNEMPLOYED_MAX_INCOME)
+        elif "Retired" in employment_tags:
+            return self._rng.randint(self.RETIRED_MIN_INCOME, self.RETIRED_MAX_INCOME)
+        elif "part-time" in employment_tags:
+            return self._rng.randint(self.PART_TIME_MIN_INCOME, self.PART_TIME_MAX_INCOME)
         
         # Base income by education level
-        education_income_map = {
-            "Less than high school": 25000,
-            "High school diploma/GED": 35000,
-            "Some college, no degree": 40000,
-            "Associate degree": 45000,
-            "Bachelor's degree": 60000,
-            "Master's degree": 75000,
-            "Professional degree": 100000,
-            "Doctoral degree": 90000
-        }
-        
-        base_income = education_income_map.get(education, 35000)
+        base_income = EDUCATION_BASE_INCOME.get(education, 35000)
         
         # Apply age-based income multiplier (peak earning years)
         if self.PEAK_EARNING_AGE_START <= age <= self.PEAK_EARNING_AGE_END:
@@ -417,20 +612,21 @@ class PeopleGenerator:
         else:
             age_multiplier = self.REDUCED_EARNING_MULTIPLIER
         
-        # Add randomness to income calculation
-        income = int(base_income * age_multiplier * random.uniform(0.7, 1.5))
+        # Add randomness to income calculation (uniform between 0.7 and 1.5)
+        income = int(base_income * age_multiplier * (0.7 + self._rng.random() * 0.8))
         return max(self.MIN_INCOME, income)
     
     def _generate_household_size(self, age: int) -> int:
         """Generate household size based on age."""
         if age < 30:
-            return random.choices([1, 2, 3, 4], weights=[40, 35, 20, 5])[0]
+            sizes, cum_weights = self._household_choices[0]
         elif age < 50:
-            return random.choices([1, 2, 3, 4, 5], weights=[20, 30, 30, 15, 5])[0]
+            sizes, cum_weights = self._household_choices[1]
         else:
-            return random.choices([1, 2, 3], weights=[30, 50, 20])[0]
+            sizes, cum_weights = self._household_choices[2]
+        return self._pick(sizes, cum_weights)
     
-    def _generate_temperament(self, age: int, education: str, employment: str) -> Dict[str, str]:
+    def _generate_temperament(self, age: int, education: str, employment: str) -> tuple:
         """
         Generate temperament based on age, education, and employment status.
         
@@ -440,22 +636,23 @@ class PeopleGenerator:
             employment (str): Employment status
             
         Returns:
-            Dict[str, str]: Dictionary containing temperament information
+            tuple: The temperament's type, description and comma-separated traits
         """
-        temperament_weights = []
-        
-        for temperament in self.temperaments:
-            weight = self._calculate_temperament_weight(temperament, age, education, employment)
-            temperament_weights.append(max(0.1, weight))  # Ensure minimum weight
+        # The weights only depend on these three, so work them out once for
+        # each combination seen
+        key = (age, education, employment)
+        cum_weights = self._temperament_cum_weights.get(key)
+        if cum_weights is None:
+            temperament_weights = []
+            
+            for temperament in self.temperaments:
+                weight = self._calculate_temperament_weight(temperament, age, education, employment)
+                temperament_weights.append(max(0.1, weight))  # Ensure minimum weight
+            
+            cum_weights = self._temperament_cum_weights[key] = list(accumulate(temperament_weights))
         
         # Select temperament based on weights
-        selected_temperament = random.choices(self.temperaments, weights=temperament_weights)[0]
-        
-        return {
-            "type": selected_temperament["type"],
-            "description": selected_temperament["description"],
-            "traits": selected_temperament["traits"]
-        }
+        return self._pick(self._temperament_fields, cum_weights)
     
     def _calculate_temperament_weight(self, temperament: Dict[str, str], age: int, 
                                     education: str, employment: str) -> float:
@@ -522,19 +719,20 @@ class PeopleGenerator:
     def _get_education_weight_adjustment(self, temperament_type: str, education: str) -> float:
         """Get education-based weight adjustment for temperament."""
         adjustment = 0
+        education_tags = self._get_education_tags(education)
         
         try:
             # Get education adjustments from config
             education_adjustments = self.config.get('temperament_weight_adjustments', {}).get('education_based', {})
             
             if temperament_type in education_adjustments:
-                if "has_degree" in education_adjustments[temperament_type] and "degree" in education.lower():
+                if "has_degree" in education_adjustments[temperament_type] and "has_degree" in education_tags:
                     adjustment += education_adjustments[temperament_type]["has_degree"]
                     
-                if "advanced_degree" in education_adjustments[temperament_type] and any(level in education for level in ["Master's", "Doctoral", "Professional"]):
+                if "advanced_degree" in education_adjustments[temperament_type] and "advanced_degree" in education_tags:
                     adjustment += education_adjustments[temperament_type]["advanced_degree"]
                     
-                if "bachelor_or_masters" in education_adjustments[temperament_type] and any(level in education for level in ["Bachelor's", "Master's"]):
+                if "bachelor_or_masters" in education_adjustments[temperament_type] and "bachelor_or_masters" in education_tags:
                     adjustment += education_adjustments[temperament_type]["bachelor_or_masters"]
                     
             return adjustment
@@ -545,36 +743,38 @@ class PeopleGenerator:
         
         # Fallback logic
         if temperament_type == "Analytical":
-            if "degree" in education.lower():
+            if "has_degree" in education_tags:
                 adjustment += 0.3
-            if any(level in education for level in ["Master's", "Doctoral", "Professional"]):
+            if "advanced_degree" in education_tags:
                 adjustment += 0.2
         elif temperament_type == "Optimistic":
-            if any(level in education for level in ["Bachelor's", "Master's"]):
+            if "bachelor_or_masters" in education_tags:
                 adjustment += 0.2
         
         return adjustment
     
     def _get_employment_weight_adjustment(self, temperament_type: str, employment: str) -> float:
         """Get employment-based weight adjustment for temperament."""
+        employment_tags = self._get_employment_tags(employment)
+        
         try:
             # Get employment adjustments from config
             employment_adjustments = self.config.get('temperament_weight_adjustments', {}).get('employment_based', {})
             
             if temperament_type in employment_adjustments:
-                if "Unemployed" in employment_adjustments[temperament_type] and "Unemployed" in employment:
+                if "Unemployed" in employment_adjustments[temperament_type] and "Unemployed" in employment_tags:
                     return employment_adjustments[temperament_type]["Unemployed"]
                     
-                if "Student" in employment_adjustments[temperament_type] and "Student" in employment:
+                if "Student" in employment_adjustments[temperament_type] and "Student" in employment_tags:
                     return employment_adjustments[temperament_type]["Student"]
                     
-                if "management_sales_law" in employment_adjustments[temperament_type] and any(job in employment for job in ["Manager", "Sales", "Lawyer"]):
+                if "management_sales_law" in employment_adjustments[temperament_type] and "management_sales_law" in employment_tags:
                     return employment_adjustments[temperament_type]["management_sales_law"]
                     
-                if "Retired" in employment_adjustments[temperament_type] and "Retired" in employment:
+                if "Retired" in employment_adjustments[temperament_type] and "Retired" in employment_tags:
                     return employment_adjustments[temperament_type]["Retired"]
                     
-                if "unemployment_disability" in employment_adjustments[temperament_type] and any(status in employment for status in ["Unemployed", "Disabled"]):
+                if "unemployment_disability" in employment_adjustments[temperament_type] and "unemployment_disability" in employment_tags:
                     return employment_adjustments[temperament_type]["unemployment_disability"]
             
         except (KeyError, TypeError):
@@ -583,22 +783,28 @@ class PeopleGenerator:
             
         # Fallback adjustments
         adjustments = {
-            "Anxious": (0.5 if "Unemployed" in employment else 
-                      0.2 if "Student" in employment else 0),
-            "Aggressive": (0.2 if any(job in employment for job in ["Manager", "Sales", "Lawyer"]) 
-                         else 0),
-            "Laid-back": 0.4 if "Retired" in employment else 0,
-            "Pessimistic": (0.3 if any(status in employment for status in ["Unemployed", "Disabled"]) 
-                          else 0),
+            "Anxious": (0.5 if "Unemployed" in employment_tags else 
+                      0.2 if "Student" in employment_tags else 0),
+            "Aggressive": 0.2 if "management_sales_law" in employment_tags else 0,
+            "Laid-back": 0.4 if "Retired" in employment_tags else 0,
+            "Pessimistic": 0.3 if "unemployment_disability" in employment_tags else 0,
         }
         return adjustments.get(temperament_type, 0)
     
-    def generate_dataset(self, num_people: int) -> List[Dict[str, str]]:
+    def generate_dataset(self, num_people: int, workers: int = 1) -> List[Dict[str, str]]:
         """
         Generate a dataset of demographic information.
         
+        With more than one worker, the people are generated in chunks of
+        WORKER_CHUNK_SIZE by a pool of worker processes, each with its own
+        generator. Each chunk is seeded from the generator's seed and the
+        chunk's position, so a seeded dataset is reproducible, though it
+        differs from the one generated by a single worker.
+        
         Args:
             num_people (int): Number of people to generate.
+            workers (int): Number of worker processes to use. Defaults to 1,
+                           generating the people in this process.
             
         Returns:
             List[Dict[str, str]]: List of demographic records.
@@ -609,9 +815,52 @@ class PeopleGenerator:
         if not isinstance(num_people, int) or num_people <= 0:
             raise ValueError("num_people must be a positive integer")
         
-        return [self.generate_person() for _ in range(num_people)]
+        return list(self.iter_dataset(num_people, workers))
+    
+    def iter_dataset(self, num_people: int, workers: int = 1) -> Iterator[Dict[str, str]]:
+        """
+        Generate demographic records one at a time, without holding the
+        whole dataset in memory.
+        
+        Args:
+            num_people (int): Number of people to generate.
+            workers (int): Number of worker processes to use, as for generate_dataset.
+            
+        Yields:
+            Dict[str, str]: Demographic records.
+        """
+        for row in self.iter_rows(num_people, workers):
+            yield _row_to_person(row)
     
-    def save_to_csv(self, num_people: int, filename: str, output_dir: str = ".") -> str:
+    def iter_rows(self, num_people: int, workers: int = 1) -> Iterator[tuple]:
+        """
+        Generate demographic records one at a time as rows of values in the
+        order of FIELDNAMES.
+        
+        Args:
+            num_people (int): Number of people to generate.
+            workers (int): Number of worker processes to use, as for generate_dataset.
+            
+        Yields:
+            tuple: Demographic records.
+        """
+        self._current_year = datetime.now().year
+        
+        if workers <= 1 or num_people <= WORKER_CHUNK_SIZE:
+            for _ in range(num_people):
+                yield self.generate_person_row()
+            return
+        
+        tasks = []
+        for index, start in enumerate(range(0, num_people, WORKER_CHUNK_SIZE)):
+            chunk_seed = None if self.seed is None else f"{self.seed}:{index}"
+            tasks.append((chunk_seed, min(WORKER_CHUNK_SIZE, num_people - start)))
+        
+        with multiprocessing.Pool(min(workers, len(tasks)), initializer=_init_worker, initargs=(self.locale,)) as pool:
+            for chunk in pool.imap(_generate_chunk, tasks):
+                yield from chunk
+    
+    def save_to_csv(self, num_people: int, filename: str, output_dir: str = ".", workers: int = 1) -> str:
         """
         Generate demographic data and save to CSV file.
         
@@ -619,6 +868,7 @@ class PeopleGenerator:
             num_people (int): Number of people to generate.
             filename (str): Name of the CSV file.
             output_dir (str): Directory to save the file. Defaults to current directory.
+            workers (int): Number of worker processes to generate the people with.
             
         Returns:
             str: Full path to the created CSV file.
@@ -633,9 +883,6 @@ class PeopleGenerator:
         if not filename or not filename.strip():
             raise ValueError("filename cannot be empty")
         
-        # Generate the dataset
-        dataset = self.generate_dataset(num_people)
-        
         # Ensure output directory exists
         try:
             os.makedirs(output_dir, exist_ok=True)
@@ -647,26 +894,25 @@ class PeopleGenerator:
             filename += '.csv'
         filepath = os.path.join(output_dir, filename)
         
-        # Write to CSV
+        # Generate the people straight into the CSV, rather than building the
+        # whole dataset in memory first
         try:
-            if dataset:
-                fieldnames = dataset[0].keys()
-                with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(dataset)
+            with open(filepath, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(FIELDNAMES)
+                writer.writerows(self.iter_rows(num_people, workers))
         except OSError as e:
             raise OSError(f"Unable to write CSV file '{filepath}': {e}")
         
         print(f"Generated {num_people} demographic records and saved to: {filepath}")
         return filepath
     
-    def _load_street_names(self) -> List[str]:
+    def _load_street_names(self) -> tuple:
         """
         Load street names from data/town_data.json if it exists.
         
         Returns:
-            List[str]: List of street names, or empty list if file doesn't exist or can't be loaded.
+            tuple: Street names, or an empty tuple if file doesn't exist or can't be loaded.
         """
         try:
             # Get the path relative to the project root
@@ -682,23 +928,13 @@ class PeopleGenerator:
                 town_data_path = os.path.join(project_root, "data", "town_data.json")
             
             if os.path.exists(town_data_path):
-                with open(town_data_path, 'r', encoding='utf-8') as file:
-                    town_data = json.load(file)
-                    
-                # Extract street names from the JSON structure
-                street_names = []
-                if 'streets' in town_data and isinstance(town_data['streets'], list):
-                    for street in town_data['streets']:
-                        if isinstance(street, dict) and 'name' in street:
-                            street_names.append(street['name'])
-                
-                return street_names
+                return _load_cached(town_data_path, _parse_street_names)
                 
         except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
             # Silently handle errors and fall back to default address generation
             pass
             
-        return []
+        return ()
     
     def _generate_address_with_town_streets(self) -> str:
         """
@@ -710,22 +946,48 @@ class PeopleGenerator:
         """
         if self.street_names:
             # Use a random street name from the loaded data
-            street_name = random.choice(self.street_names)
+            street_name = self._rng.choice(self.street_names)
             # Generate a house number
-            house_number = random.randint(1, 999)
+            house_number = self._rng.randint(1, 999)
             # Generate the rest of the address using Faker
-            city = self.fake.city()
-            postcode = self.fake.postcode() if hasattr(self.fake, 'postcode') else self.fake.zipcode()
+            city = self._city()
+            postcode = self._postcode()
             
             # Construct the address
             address = f"{house_number} {street_name}, {city}, {postcode}"
             return address
         else:
             # Fall back to Faker's default address generation
-            return self.fake.address().replace('\n', ', ')
+            return self._address().replace('\n', ', ')
+
+
+# Generator of each worker process used by PeopleGenerator.generate_dataset
+_worker_generator = None
+
+
+def _init_worker(locale: str) -> None:
+    """Create the generator for a dataset worker process."""
+    global _worker_generator
+    _worker_generator = PeopleGenerator(locale=locale)
+
+
+def _generate_chunk(task) -> List[tuple]:
+    """
+    Generate a chunk of people in a dataset worker process.
+    
+    Args:
+        task: Tuple of the chunk's seed (None to seed from the OS, so forked
+              workers don't repeat each other) and the number of people.
+    
+    Returns:
+        List[tuple]: List of demographic records, as rows in the order of FIELDNAMES.
+    """
+    chunk_seed, size = task
+    _worker_generator.reseed(chunk_seed)
+    return [_worker_generator.generate_person_row() for _ in range(size)]
 
 
-def generate_demographic_csv(num_people: int, filename: str, output_dir: str = "data", locale: str = "en_US", seed: Optional[int] = None) -> str:
+def generate_demographic_csv(num_people: int, filename: str, output_dir: str = "data", locale: str = "en_US", seed: Optional[int] = None, workers: int = 1) -> str:
     """
     Convenience function for quick CSV generation of demographic data.
     
@@ -735,23 +997,22 @@ def generate_demographic_csv(num_people: int, filename: str, output_dir: str = "
         output_dir (str): Directory to save the file. Defaults to "data".
         locale (str): Faker locale to use for generation. Defaults to "en_US".
         seed (Optional[int]): Random seed for reproducible results.
+        workers (int): Number of worker processes to generate the people with. Defaults to 1.
         
     Returns:
         str: Full path to the created CSV file.
     """
     generator = PeopleGenerator(locale=locale, seed=seed)
-    return generator.save_to_csv(num_people, filename, output_dir)
+    return generator.save_to_csv(num_people, filename, output_dir, workers)
 
 
 if __name__ == "__main__":
     # Load configuration
-    config_path = os.path.join(os.path.dirname(__file__), 'people_config.yaml')
     defaults = {}
     
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
-            defaults = config.get('generation_defaults', {})
+        config = _load_cached(CONFIG_FILE, _parse_config)
+        defaults = config.get('generation_defaults', {})
     except (FileNotFoundError, yaml.YAMLError) as e:
         print(f"Warning: Could not load people_config.yaml: {e}")
     
@@ -32,7 +32,8 @@ Classes:
 import random
 import os
 import yaml
-from datetime import datetime
+from datetime import datetime, timezone
+from itertools import accumulate
 from typing import Dict, Optional
 import uuid
 from faker import Faker
@@ -40,6 +41,39 @@ from faker import Faker
 import json
 from typing import List
 
+# Configuration file of the town generator
+CONFIG_FILE = os.path.join(os.path.dirname(__file__), 'town_config.yaml')
+
+# Prefer the libyaml-backed loader, falling back to the pure Python one
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Use orjson for encoding when it is installed, it is considerably faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Parsed town_config.yaml, as a (mtime_ns, config) tuple
+_CONFIG_CACHE = None
+
+
+def _load_config() -> Dict:
+    """
+    Load town_config.yaml, reusing the parsed config while its mtime is unchanged.
+    
+    Returns:
+        Dict: Configuration dictionary (shared between callers, so it must not be modified).
+    """
+    global _CONFIG_CACHE
+    mtime = os.stat(CONFIG_FILE).st_mtime_ns
+    if _CONFIG_CACHE is None or _CONFIG_CACHE[0] != mtime:
+        with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
+            _CONFIG_CACHE = (mtime, yaml.load(f, Loader=SafeLoader))
+    return _CONFIG_CACHE[1]
+
 
 class TownGenerator:
     """
@@ -64,20 +98,29 @@ class TownGenerator:
         self.locale = locale
         
         # Load configuration from YAML file
-        config_path = os.path.join(os.path.dirname(__file__), 'town_config.yaml')
-        with open(config_path, 'r', encoding='utf-8') as f:
-            self.config = yaml.safe_load(f)
+        self.config = _load_config()
         
         # Extract configuration sections for easy access
         self.town_sizes = self.config['town_sizes']
         self.street_patterns = self.config['street_patterns']
         self.business_types = self.config['business_types']
+        self._business_type_choices = list(self.business_types.keys())
+        self._business_type_cum_weights = list(accumulate(self.business_types.values()))
         self.landmark_types = self.config['landmark_types']
         self.park_types = self.config['park_types']
         self.school_types = self.config['school_types']
         self.service_types = self.config['service_types']
         self.country_mapping = self.config['country_mapping']
         self.name_components = self.config['name_components']
+        
+        # Street name parts used for every street, looked up once
+        if self.locale not in self.street_patterns:
+            raise ValueError(f"No street patterns configured for locale '{self.locale}'")
+        self._street_patterns = self.street_patterns[self.locale]
+        self._tree_names = self.name_components['tree_names']
+        self._street_prefixes = self.name_components['street_prefixes']
+        self._directional_prefixes = self.name_components['directional_prefixes']
+        self._ordinal_prefixes = self.name_components['ordinal_prefixes']
     
     def get_country_name(self) -> str:
         """Get the country name for the current locale."""
@@ -86,23 +129,20 @@ class TownGenerator:
     @staticmethod
     def get_available_locales() -> List[str]:
         """Get list of available locales."""
-        config_path = os.path.join(os.path.dirname(__file__), 'town_config.yaml')
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
-        return list(config['country_mapping'].keys())
+        return list(_load_config()['country_mapping'].keys())
     
     def _generate_street_name(self) -> str:
         """Generate a realistic street name based on locale."""
-        patterns = self.street_patterns.get(self.locale, self.street_patterns[self.locale])
+        patterns = self._street_patterns
         
         # Generate street name using various patterns
         patterns_methods = [
             lambda: f"{self.fake.last_name()} {random.choice(patterns)}",
             lambda: f"{self.fake.first_name()} {random.choice(patterns)}",
-            lambda: f"{random.choice(self.name_components['tree_names'])} {random.choice(patterns)}",
-            lambda: f"{random.choice(self.name_components['street_prefixes'])} {random.choice(patterns)}",
-            lambda: f"{random.choice(self.name_components['directional_prefixes'])} {random.choice(patterns)}",
-            lambda: f"{random.choice(self.name_components['ordinal_prefixes'])} {random.choice(patterns)}"
+            lambda: f"{random.choice(self._tree_names)} {random.choice(patterns)}",
+            lambda: f"{random.choice(self._street_prefixes)} {random.choice(patterns)}",
+            lambda: f"{random.choice(self._directional_prefixes)} {random.choice(patterns)}",
+            lambda: f"{random.choice(self._ordinal_prefixes)} {random.choice(patterns)}"
         ]
         
         return random.choice(patterns_methods)()
@@ -111,34 +151,37 @@ class TownGenerator:
         """Generate a realistic business name based on type."""
         adjectives = self.name_components['business_name_adjectives']
         
+        # Only the chosen pattern is built, so the Faker calls of the others
+        # aren't made for nothing
         if business_type == "Restaurant/Café":
-            patterns = [
-                f"{self.fake.last_name()}'s Restaurant",
-                f"The {random.choice(adjectives['descriptive'])} {random.choice(self.name_components['business_name_nouns']['restaurant'])}",
-                f"{random.choice(['Mama', 'Papa', 'Tony', 'Mario', 'Luigi'])}'s {random.choice(['Pizza', 'Diner', 'Bistro', 'Café'])}",
-                f"{self.fake.city()[:6]} {random.choice(['Grill', 'Diner', 'Café', 'Bistro'])}"
+            patterns_methods = [
+                lambda: f"{self.fake.last_name()}'s Restaurant",
+                lambda: f"The {random.choice(adjectives['descriptive'])} {random.choice(self.name_components['business_name_nouns']['restaurant'])}",
+                lambda: f"{random.choice(['Mama', 'Papa', 'Tony', 'Mario', 'Luigi'])}'s {random.choice(['Pizza', 'Diner', 'Bistro', 'Café'])}",
+                lambda: f"{self.fake.city()[:6]} {random.choice(['Grill', 'Diner', 'Café', 'Bistro'])}"
             ]
         elif business_type == "Retail Store":
-            patterns = [
-                f"{self.fake.last_name()}'s {random.choice(self.name_components['business_name_nouns']['retail'])}",
-                f"{random.choice(adjectives['location_based'])} {random.choice(['Market', 'Store', 'Shop'])}",
-                f"The {random.choice(adjectives['size_based'])} {random.choice(['Shop', 'Store', 'Market'])}"
+            patterns_methods = [
+                lambda: f"{self.fake.last_name()}'s {random.choice(self.name_components['business_name_nouns']['retail'])}",
+                lambda: f"{random.choice(adjectives['location_based'])} {random.choice(['Market', 'Store', 'Shop'])}",
+                lambda: f"The {random.choice(adjectives['size_based'])} {random.choice(['Shop', 'Store', 'Market'])}"
             ]
         elif business_type == "Gas Station":
-            patterns = [
-                f"{random.choice(adjectives['speed_based'])} {random.choice(self.name_components['business_name_nouns']['gas'])}",
-                f"{self.fake.last_name()}'s {random.choice(['Gas', 'Fuel', 'Service'])}",
-                f"{random.choice(adjectives['location_based'])} {random.choice(['Gas', 'Fuel', 'Station'])}"
+            patterns_methods = [
+                lambda: f"{random.choice(adjectives['speed_based'])} {random.choice(self.name_components['business_name_nouns']['gas'])}",
+                lambda: f"{self.fake.last_name()}'s {random.choice(['Gas', 'Fuel', 'Service'])}",
+                lambda: f"{random.choice(adjectives['location_based'])} {random.choice(['Gas', 'Fuel', 'Station'])}"
             ]
         else:
             # Generic business names
-            patterns = [
-                f"{self.fake.last_name()}'s {business_type.split('/')[0]}",
-                f"{self.fake.city()[:6]} {business_type.split('/')[0]}",
-                f"{random.choice(adjectives['descriptive'])} {business_type.split('/')[0]}"
+            business_kind = business_type.split('/')[0]
+            patterns_methods = [
+                lambda: f"{self.fake.last_name()}'s {business_kind}",
+                lambda: f"{self.fake.city()[:6]} {business_kind}",
+                lambda: f"{random.choice(adjectives['descriptive'])} {business_kind}"
             ]
         
-        return random.choice(patterns)
+        return random.choice(patterns_methods)()
     
     def _generate_landmark_name(self, landmark_type: str) -> str:
         """Generate a realistic landmark name."""
@@ -158,12 +201,12 @@ class TownGenerator:
     def _generate_park_name(self, park_type: str) -> str:
         """Generate a realistic park name."""
         name_patterns = [
-            f"{self.fake.last_name()} {park_type}",
-            f"{random.choice(self.name_components['park_prefixes'])} {park_type}",
-            f"{random.choice(self.name_components['tree_names'])} {park_type}",
-            f"Memorial {park_type}"
+            lambda: f"{self.fake.last_name()} {park_type}",
+            lambda: f"{random.choice(self.name_components['park_prefixes'])} {park_type}",
+            lambda: f"{random.choice(self.name_components['tree_names'])} {park_type}",
+            lambda: f"Memorial {park_type}"
         ]
-        return random.choice(name_patterns)
+        return random.choice(name_patterns)()
     
     def _generate_school_name(self, school_type: str) -> str:
         """Generate a realistic school name."""
@@ -198,31 +241,39 @@ class TownGenerator:
         
         population = random.randint(*size_config["population_range"])
         
+        # Generate the town's ID from the (possibly seeded) random generator.
+        # Its entities are numbered under a prefix of it rather than each
+        # getting a UUID of their own, which is all synthetic data needs.
+        town_id = str(uuid.UUID(int=random.getrandbits(128), version=4))
+        id_prefix = town_id.replace('-', '')[:12]
+        
         # Generate streets
         street_count = random.randint(*size_config["street_count_range"])
         streets = []
-        for _ in range(street_count):
+        for i in range(street_count):
             streets.append({
-                "id": str(uuid.uuid4()),
+                "id": f"{id_prefix}-street-{i}",
                 "name": self._generate_street_name(),
                 "type": random.choice(["Residential", "Commercial", "Mixed", "Industrial"]),
                 "length_km": round(random.uniform(0.2, 2.5), 2)
             })
         
+        street_names = [street["name"] for street in streets]
+        
         # Generate businesses
         business_count = random.randint(*size_config["business_count_range"])
         businesses = []
-        for _ in range(business_count):
-            business_type = random.choices(
-                list(self.business_types.keys()),
-                weights=list(self.business_types.values())
-            )[0]
-            
+        business_types = random.choices(
+            self._business_type_choices,
+            cum_weights=self._business_type_cum_weights,
+            k=business_count
+        )
+        for i, business_type in enumerate(business_types):
             businesses.append({
-                "id": str(uuid.uuid4()),
+                "id": f"{id_prefix}-business-{i}",
                 "name": self._generate_business_name(business_type),
                 "type": business_type,
-                "street": random.choice(streets)["name"],
+                "street": random.choice(street_names),
                 "employees": random.randint(1, 50),
                 "established_year": random.randint(1950, 2023)
             })
@@ -230,13 +281,13 @@ class TownGenerator:
         # Generate landmarks
         landmark_count = random.randint(*size_config["landmark_count_range"])
         landmarks = []
-        for _ in range(landmark_count):
+        for i in range(landmark_count):
             landmark_type = random.choice(self.landmark_types)
             landmarks.append({
-                "id": str(uuid.uuid4()),
+                "id": f"{id_prefix}-landmark-{i}",
                 "name": self._generate_landmark_name(landmark_type),
                 "type": landmark_type,
-                "street": random.choice(streets)["name"],
+                "street": random.choice(street_names),
                 "established_year": random.randint(1800, 2020),
                 "historical_significance": random.choice(self.name_components["historical_significance_levels"])
             })
@@ -244,29 +295,30 @@ class TownGenerator:
         # Generate parks
         park_count = random.randint(*size_config["park_count_range"])
         parks = []
-        for _ in range(park_count):
+        facility_types = self.name_components["facility_types"]
+        for i in range(park_count):
             park_type = random.choice(self.park_types)
             parks.append({
-                "id": str(uuid.uuid4()),
+                "id": f"{id_prefix}-park-{i}",
                 "name": self._generate_park_name(park_type),
                 "type": park_type,
                 "area_hectares": round(random.uniform(0.5, 20.0), 2),
-                "facilities": random.choices(
-                    self.name_components["facility_types"],
-                    k=random.randint(1, 4)
+                "facilities": random.sample(
+                    facility_types,
+                    k=random.randint(1, min(4, len(facility_types)))
                 )
             })
         
         # Generate schools
         school_count = random.randint(*size_config["school_count_range"])
         schools = []
-        for _ in range(school_count):
+        for i in range(school_count):
             school_type = random.choice(self.school_types)
             schools.append({
-                "id": str(uuid.uuid4()),
+                "id": f"{id_prefix}-school-{i}",
                 "name": self._generate_school_name(school_type),
                 "type": school_type,
-                "street": random.choice(streets)["name"],
+                "street": random.choice(street_names),
                 "students": random.randint(50, 1200),
                 "established_year": random.randint(1900, 2020)
             })
@@ -274,20 +326,20 @@ class TownGenerator:
         # Generate public services
         service_count = random.randint(*size_config["service_count_range"])
         services = []
-        for _ in range(service_count):
+        for i in range(service_count):
             service_type = random.choice(self.service_types)
             services.append({
-                "id": str(uuid.uuid4()),
+                "id": f"{id_prefix}-service-{i}",
                 "name": f"{town_name} {service_type}",
                 "type": service_type,
-                "street": random.choice(streets)["name"],
+                "street": random.choice(street_names),
                 "operating_hours": f"{random.randint(6, 9)}:00 AM - {random.randint(4, 8)}:00 PM",
                 "staff_count": random.randint(2, 25)
             })
         
         # Store the generated town data
         self.town_data = {
-            "id": str(uuid.uuid4()),
+            "id": town_id,
             "name": town_name,
             "country": self.get_country_name(),
             "locale": self.locale,
@@ -303,7 +355,7 @@ class TownGenerator:
             "parks": parks,
             "schools": schools,
             "services": services,
-            "generated_at": datetime.now().isoformat()
+            "generated_at": datetime.now(timezone.utc).isoformat(timespec='seconds')
         }
         
         return self.town_data
@@ -326,10 +378,16 @@ class TownGenerator:
         os.makedirs(output_dir, exist_ok=True)
         filepath = os.path.join(output_dir, filename)
         
+        # Serialize the whole town up front and write it in a single call
+        if orjson is not None:
+            data = orjson.dumps(self.town_data, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(self.town_data, indent=2, ensure_ascii=False).encode('utf-8')
+        
         # Write to JSON
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(self.town_data, f, indent=2, ensure_ascii=False)
+            with open(filepath, 'wb') as f:
+                f.write(data)
         except OSError as e:
             raise OSError(f"Unable to write JSON file '{filepath}': {e}")
         
@@ -353,8 +411,9 @@ def generate_town_json(town_name: Optional[str] = None, size: str = "medium",
     Returns:
         str: Full path to the created JSON file.
     """
-    if locale not in TownGenerator.get_available_locales():
-        raise ValueError(f"Invalid locale '{locale}'. Available locales: {TownGenerator.get_available_locales()}")
+    available_locales = TownGenerator.get_available_locales()
+    if locale not in available_locales:
+        raise ValueError(f"Invalid locale '{locale}'. Available locales: {available_locales}")
     
     generator = TownGenerator(locale=locale, seed=seed)
     generator.generate_town(town_name, size)
@@ -364,12 +423,9 @@ def generate_town_json(town_name: Optional[str] = None, size: str = "medium",
 if __name__ == "__main__":
     # Show available locales
     print("Available locales:")
-    available_locales = TownGenerator.get_available_locales()
-    for locale in available_locales:
-        config_path = os.path.join(os.path.dirname(__file__), 'town_config.yaml')
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
-        print(f"  {locale}: {config['country_mapping'].get(locale, 'Unknown')}")
+    country_mapping = _load_config()['country_mapping']
+    for locale in country_mapping:
+        print(f"  {locale}: {country_mapping[locale]}")
     
     print("\n" + "="*50)
     
@@ -3,11 +3,29 @@ Module for interacting with the OpenAI API.
 """
 import os
 import json
-from openai import OpenAI
+import logging
+import threading
+from openai import OpenAI, AsyncOpenAI
 from pathlib import Path
+from types import MappingProxyType
 from typing import List, Dict, Any, Optional
 
-print("Initializing OpenAI module...")
+logger = logging.getLogger(__name__)
+
+# Model arguments used when a call doesn't give any
+DEFAULT_MODEL_ARGS = MappingProxyType({
+    'model': 'gpt-4o-mini',
+    'temperature': 0.7,
+    'max_tokens': 1024,
+    'top_p': 0.95
+})
+
+# Clients shared by the synchronous API calls, keyed by the API key they use
+_CLIENTS = {}
+_CLIENTS_LOCK = threading.Lock()
+
+# API keys read from credentials files, keyed by path, as (mtime_ns, key) tuples
+_FILE_API_KEYS = {}
 
 def load_api_key(credentials_file: str = None) -> str:
     """
@@ -27,7 +45,7 @@ def load_api_key(credentials_file: str = None) -> str:
     # Try to get from environment variable first
     api_key = os.environ.get('OPENAI_API_KEY')
     if api_key:
-        print("Found API key in environment variable")
+        logger.debug("Found API key in environment variable")
         return api_key
     
     # If no environment variable, try to load from credentials file
@@ -36,30 +54,47 @@ def load_api_key(credentials_file: str = None) -> str:
         root_dir = Path(__file__).parent.parent.parent.parent
         credentials_file = root_dir / 'credentials'
     
-    print(f"Looking for credentials file at: {credentials_file}")
+    logger.debug("Looking for credentials file at: %s", credentials_file)
     
     # Read credentials file
     if not os.path.exists(credentials_file):
         raise FileNotFoundError(f"Credentials file not found: {credentials_file}")
     
+    # Reuse the key read from the file while the file is unchanged
+    key = str(credentials_file)
+    mtime = os.stat(credentials_file).st_mtime_ns
+    cached = _FILE_API_KEYS.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    api_key = _parse_credentials(Path(credentials_file).read_text())
+    _FILE_API_KEYS[key] = (mtime, api_key)
+    return api_key
+
+def _parse_credentials(data: str) -> str:
+    """
+    Extract the OpenAI API key from the contents of a credentials file, either
+    JSON with an 'openai_api_key' entry or an 'export OPENAI_API_KEY=' line.
+    
+    Raises:
+        KeyError: If the API key is not found in the credentials
+    """
     try:
-        with open(credentials_file, 'r') as file:
-            creds = json.load(file)
+        creds = json.loads(data)
         
         if 'openai_api_key' not in creds:
             raise KeyError("OpenAI API key not found in credentials file")
         
-        print("Found API key in credentials file")
+        logger.debug("Found API key in credentials file")
         return creds['openai_api_key']
     except json.JSONDecodeError:
         # The file might be in env var format instead of JSON
-        with open(credentials_file, 'r') as file:
-            for line in file:
-                if line.startswith('export OPENAI_API_KEY='):
-                    # Extract the key from the export statement
-                    api_key = line.strip().split('=')[1].strip('"\'')
-                    print("Found API key in credentials file (env format)")
-                    return api_key
+        for line in data.splitlines():
+            if line.startswith('export OPENAI_API_KEY='):
+                # Extract the key from the export statement
+                api_key = line.strip().split('=')[1].strip('"\'')
+                logger.debug("Found API key in credentials file (env format)")
+                return api_key
         
         raise KeyError("OpenAI API key not found in credentials file")
 
@@ -78,6 +113,110 @@ def initialize_openai_client(api_key: str = None) -> OpenAI:
     
     return OpenAI(api_key=api_key)
 
+def get_client(api_key: str = None) -> OpenAI:
+    """
+    Get the OpenAI client shared by calls made with the same API key, creating
+    it on first use so its connections are kept alive and reused.
+    
+    The key is loaded on every call when none is given, so a changed
+    environment variable or credentials file gets a client of its own.
+    
+    Args:
+        api_key: The OpenAI API key. If None, will attempt to load it.
+        
+    Returns:
+        An OpenAI client instance
+    """
+    if api_key is None:
+        api_key = load_api_key()
+    
+    client = _CLIENTS.get(api_key)
+    if client is None:
+        with _CLIENTS_LOCK:
+            client = _CLIENTS.get(api_key)
+            if client is None:
+                client = initialize_openai_client(api_key)
+                _CLIENTS[api_key] = client
+    return client
+
+def initialize_async_openai_client(api_key: str = None) -> AsyncOpenAI:
+    """
+    Initialize the asynchronous OpenAI client with the provided API key.
+    
+    The client should be shared by the requests made within one event loop,
+    and closed when they are done.
+    
+    Args:
+        api_key: The OpenAI API key. If None, will attempt to load it.
+        
+    Returns:
+        An AsyncOpenAI client instance
+    """
+    if api_key is None:
+        api_key = load_api_key()
+    
+    return AsyncOpenAI(api_key=api_key)
+
+def _build_chat_request(
+    system_prompt: str,
+    messages: List[Dict[str, str]],
+    model_args: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Build the arguments for a chat completion request.
+    
+    Args:
+        system_prompt: The system prompt to set the behavior of the model
+        messages: A list of message dictionaries with 'role' and 'content' keys
+        model_args: Optional dictionary of model arguments like temperature, max_tokens, etc.
+        
+    Returns:
+        Dictionary of keyword arguments for chat.completions.create
+    """
+    # Work on a copy, so the caller's model_args can be passed again
+    model_args = dict(DEFAULT_MODEL_ARGS if model_args is None else model_args)
+    
+    # Get the model name and remove it from model_args
+    model_name = model_args.pop('model', 'gpt-4o-mini')
+    
+    # Extract message parameters
+    temperature = model_args.pop('temperature', 0.7)
+    max_tokens = model_args.pop('max_tokens', 1024)  # Different name in OpenAI API
+    top_p = model_args.pop('top_p', 0.95)
+    
+    # Prepare the conversation messages
+    chat_messages = []
+    
+    # Add the system message if provided
+    if system_prompt:
+        chat_messages.append({"role": "system", "content": system_prompt})
+        logger.debug("Using system prompt: %s", system_prompt)
+    
+    # Process messages - they should already be in the right format
+    for message in messages:
+        role = message.get('role', '').lower()
+        content = message.get('content', '')
+        
+        # Validate role
+        if role not in ['user', 'assistant', 'system']:
+            logger.warning("Invalid role '%s', defaulting to 'user'", role)
+            role = 'user'
+            
+        chat_messages.append({"role": role, "content": content})
+    
+    # If no messages were provided, add a default user message
+    if not chat_messages or (len(chat_messages) == 1 and chat_messages[0]["role"] == "system"):
+        chat_messages.append({"role": "user", "content": "Hello"})
+    
+    return {
+        'model': model_name,
+        'messages': chat_messages,
+        'temperature': temperature,
+        'max_tokens': max_tokens,
+        'top_p': top_p,
+        **model_args  # Include any remaining model arguments
+    }
+
 def call_openai_api(
     system_prompt: str,
     messages: List[Dict[str, str]],
@@ -102,66 +241,65 @@ def call_openai_api(
         Exception: If there's an error with the API call
     """
     try:
-        # Initialize the API client with the provided API key or load it from credentials
-        client = initialize_openai_client(api_key)
-        
-        # Set default model arguments if not provided
-        if model_args is None:
-            model_args = {
-                'model': 'gpt-4o-mini',
-                'temperature': 0.7,
-                'max_tokens': 1024,
-                'top_p': 0.95
-            }
-        
-        # Get the model name and remove it from model_args
-        model_name = model_args.pop('model', 'gpt-4o-mini')
-        
-        # Extract message parameters
-        temperature = model_args.pop('temperature', 0.7)
-        max_tokens = model_args.pop('max_tokens', 1024)  # Different name in OpenAI API
-        top_p = model_args.pop('top_p', 0.95)
-        
-        # Prepare the conversation messages
-        chat_messages = []
-        
-        # Add the system message if provided
-        if system_prompt:
-            chat_messages.append({"role": "system", "content": system_prompt})
-            print(f"Using system prompt: {system_prompt}")
-        
-        # Process messages - they should already be in the right format
-        for message in messages:
-            role = message.get('role', '').lower()
-            content = message.get('content', '')
-            
-            # Validate role
-            if role not in ['user', 'assistant', 'system']:
-                print(f"Warning: Invalid role '{role}', defaulting to 'user'")
-                role = 'user'
-                
-            chat_messages.append({"role": role, "content": content})
-        
-        # If no messages were provided, add a default user message
-        if not chat_messages or (len(chat_messages) == 1 and chat_messages[0]["role"] == "system"):
-            chat_messages.append({"role": "user", "content": "Hello"})
+        # Reuse the API client for the provided API key, or the one loaded from credentials
+        client = get_client(api_key)
         
         # Send the chat completion request
         response = client.chat.completions.create(
-            model=model_name,
-            messages=chat_messages,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            top_p=top_p,
-            **model_args  # Include any remaining model arguments
+            **_build_chat_request(system_prompt, messages, model_args)
+        )
+        
+        # Return the text response
+        return response.choices[0].message.content
+        
+    except Exception as e:
+        logger.error("Error calling OpenAI API: %s", e)
+        raise
+
+async def call_openai_api_async(
+    system_prompt: str,
+    messages: List[Dict[str, str]],
+    model_args: Optional[Dict[str, Any]] = None,
+    api_key: Optional[str] = None,
+    client: Optional[AsyncOpenAI] = None
+) -> str:
+    """
+    Call the OpenAI API without blocking the event loop, so that several
+    requests can be awaited concurrently.
+    
+    Args:
+        system_prompt: The system prompt to set the behavior of the model
+        messages: A list of message dictionaries with 'role' and 'content' keys
+        model_args: Optional dictionary of model arguments like temperature, max_tokens, etc.
+        api_key: Optional API key to use when no client is given
+        client: Optional AsyncOpenAI client shared between calls. If None, a
+                client is created for this call and closed afterwards.
+                   
+    Returns:
+        The generated response text
+        
+    Raises:
+        Exception: If there's an error with the API call
+    """
+    own_client = client is None
+    try:
+        if own_client:
+            client = initialize_async_openai_client(api_key)
+        
+        # Send the chat completion request
+        response = await client.chat.completions.create(
+            **_build_chat_request(system_prompt, messages, model_args)
         )
         
         # Return the text response
         return response.choices[0].message.content
         
     except Exception as e:
-        print(f"Error calling OpenAI API: {e}")
+        logger.error("Error calling OpenAI API: %s", e)
         raise
+    finally:
+        if own_client and client is not None:
+            await client.close()
 
 def simple_openai_prompt(
     prompt: str,
@@ -183,7 +321,7 @@ def simple_openai_prompt(
         The generated response text
     """
     messages = [{'role': 'user', 'content': prompt}]  # Single user message in dictionary format
-    print(f"Sending prompt: '{prompt[:50]}...' with system instruction")
+    logger.debug("Sending prompt: '%s...' with system instruction", prompt[:50])
     return call_openai_api(system_instruction, messages, model_args, api_key)
 
 if __name__ == "__main__":